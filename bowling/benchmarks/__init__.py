@@ -0,0 +1,5 @@
+from .cases import CASES, Case, DISTRIBUTIONS, make_input
+from .history import baseline_run, connect, git_commit, load_run, save_run
+from .regression import (Comparison, compare, compare_runs, holm,
+                         mann_whitney_slower, repeats_needed, run_drift)
+from .runner import run_benchmarks, time_case
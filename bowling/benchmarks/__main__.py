@@ -0,0 +1,121 @@
+"""Times the sorts and partitions and flags slowdowns
+
+Usage:
+ python -m bowling.benchmarks --sizes 1000 10000 --distributions random sorted
+"""
+# python
+from statistics import median
+
+import argparse
+import sys
+
+# this package
+from .cases import CASES, DISTRIBUTIONS
+from .history import DEFAULT_DATABASE, baseline_run, connect, load_run, save_run
+from .regression import (DEFAULT_ALPHA, DEFAULT_FLOOR, DEFAULT_TOLERANCE,
+                         compare_runs, repeats_needed, run_drift)
+from .runner import (DEFAULT_REPEATS, DEFAULT_SIZES, MAX_REPEATS,
+                     run_benchmarks)
+
+
+def repeat_count(text: str) -> int:
+    """Parses --repeats, which has to be from 1 to MAX_REPEATS"""
+    repeats = int(text)
+    if not 1 <= repeats <= MAX_REPEATS:
+        raise argparse.ArgumentTypeError(
+            f"has to be from 1 to {MAX_REPEATS}, not {repeats}")
+    return repeats
+
+
+def arguments(argv: list=None) -> argparse.Namespace:
+    """Parses the command line"""
+    parser = argparse.ArgumentParser(
+        prog="python -m bowling.benchmarks",
+        description="Time the sorts and partitions and compare to the last run.")
+    parser.add_argument("--algorithms", nargs="+",
+                        choices=[case.name for case in CASES],
+                        help="what to time (default is everything)")
+    parser.add_argument("--distributions", nargs="+", default=["random"],
+                        choices=list(DISTRIBUTIONS),
+                        help="input orderings (default: %(default)s)")
+    parser.add_argument("--sizes", nargs="+", type=int,
+                        default=list(DEFAULT_SIZES),
+                        help="input sizes (default: %(default)s)")
+    parser.add_argument("--repeats", type=repeat_count, default=DEFAULT_REPEATS,
+                        help=(f"runs per case, at most {MAX_REPEATS} "
+                              "(default: %(default)s)"))
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed for the inputs (default: %(default)s)")
+    parser.add_argument("--database", default=DEFAULT_DATABASE,
+                        help="SQLite history file (default: %(default)s)")
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA,
+                        help="significance level (default: %(default)s)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=("fraction slower the median has to be to get "
+                              "flagged (default: %(default)s)"))
+    parser.add_argument("--floor", type=float, default=DEFAULT_FLOOR,
+                        help=("seconds slower the median has to be to get "
+                              "flagged (default: %(default)s)"))
+    parser.add_argument("--no-save", action="store_true",
+                        help="compare to the baseline without saving this run")
+    return parser.parse_args(argv)
+
+
+def main(argv: list=None) -> int:
+    """Runs the benchmarks, saves them and reports slowdowns
+
+    Returns:
+     exit code: 1 if anything got significantly slower, 2 if there
+     aren't enough repeats to ever flag anything, 0 otherwise
+    """
+    options = arguments(argv)
+    cases = [case for case in CASES
+             if not options.algorithms or case.name in options.algorithms]
+    tests = len(options.distributions) * sum(
+        1 for size in options.sizes for case in cases
+        if case.largest is None or size <= case.largest)
+    needed = repeats_needed(options.alpha, max(tests, 1))
+    if options.repeats < needed:
+        print(f"With --repeats {options.repeats} no p-value can get under "
+              f"alpha={options.alpha} corrected for {tests} cases, "
+              f"use at least {needed}.", file=sys.stderr)
+        return 2
+
+    timings = run_benchmarks(cases, options.distributions, options.sizes,
+                             options.repeats, options.seed)
+
+    connection = connect(options.database)
+    run_id = None if options.no_save else save_run(connection, timings)
+    baseline_id = baseline_run(connection, before=run_id)
+    baseline = load_run(connection, baseline_id) if baseline_id else {}
+    connection.close()
+
+    comparisons = compare_runs(baseline, timings, options.alpha,
+                               options.tolerance, options.floor)
+    slower = 0
+    print(f"{'algorithm':<32}{'distribution':<15}{'size':>8}"
+          f"{'median (s)':>14}{'ratio':>8}{'p':>8}")
+    for key, seconds in timings.items():
+        algorithm, distribution, size = key
+        line = (f"{algorithm:<32}{distribution:<15}{size:>8}"
+                f"{median(seconds):>14.6f}")
+        if key in comparisons:
+            comparison = comparisons[key]
+            line += f"{comparison.ratio:>8.2f}{comparison.p_value:>8.3f}"
+            if comparison.slower:
+                slower += 1
+                line += "  SLOWER"
+        print(line)
+
+    if baseline_id is None:
+        print("No earlier run to compare to.")
+    else:
+        print(f"The calibration workload took {run_drift(baseline, timings):.2f}"
+              f" times as long as in run {baseline_id}.")
+        if slower:
+            print(f"{slower} significant slowdown(s) against run {baseline_id}.")
+    return int(slower > 0)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
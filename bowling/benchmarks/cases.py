@@ -0,0 +1,264 @@
+# python
+from collections.abc import Callable, MutableSequence
+from functools import partial
+
+import random
+
+# pypi
+# https://www.attrs.org/en/stable/index.html
+from attrs import define
+
+# this project
+from bowling.data_structures.heap import IndexedHeap, MaxHeap
+from bowling.sort.bubble.bubble import bubba, bubble
+from bowling.sort.heap import HeapSort, heapsort
+from bowling.sort.insertion import binary_insertion_sort, insertion_sort
+from bowling.sort.merge import (bottom_up_mergesort, mergesort,
+                                natural_mergesort)
+from bowling.sort.quick import (clrs_partition, dual_pivot_partition,
+                                introsort, introsort_dual_pivot,
+                                introsort_three_way, levitins_partition,
+                                randomized_partition, three_way_partition)
+from bowling.sort.selection import selection_counter
+from bowling.sort.shell import shell_sort
+
+QUADRATIC_LIMIT = 5000
+
+HEAP_ARITIES = (2, 4, 8)
+# the decrease-key workload does this many updates per item and pops
+# once every POP_EVERY updates, roughly like Dijkstra on a sparse graph
+UPDATES_PER_ITEM = 4
+POP_EVERY = 8
+UPDATE_STRIDE = 7919
+
+
+@define
+class Case:
+    """Something to time
+
+    Args:
+     name: what to call it in the results
+     run: function that takes the (copied) input list
+     largest: biggest input size to run it on (None for no limit)
+    """
+    name: str
+    run: Callable[[MutableSequence], object]
+    largest: int = None
+
+
+def _partitioner(partition: Callable) -> Callable[[MutableSequence], object]:
+    """Makes a whole-list partition out of a sub-list partition"""
+    def run(collection: MutableSequence) -> object:
+        return partition(collection, 0, len(collection) - 1)
+    return run
+
+
+def _heap_sort_class(collection: MutableSequence) -> None:
+    """Runs the HeapSort class on the collection"""
+    HeapSort(collection)()
+    return
+
+
+def max_heap_pops(arity: int) -> Callable[[MutableSequence], object]:
+    """Makes a pop-heavy MaxHeap workload: push everything then pop it all
+
+    Args:
+     arity: children per node in the heap
+
+    Returns:
+     function that runs the workload on a list of keys
+    """
+    def run(collection: MutableSequence) -> None:
+        heap = MaxHeap(arity=arity)
+        for key in collection:
+            heap.push(key)
+        while heap:
+            heap.pop()
+        return
+    return run
+
+
+def max_heap_churn(arity: int) -> Callable[[MutableSequence], object]:
+    """Makes a MaxHeap workload that mixes pushes and pops as it goes
+
+    Every key is pushed and every other push is followed by a pop, so
+    the heap grows to about half the keys, the way a queue that's fed
+    and drained at the same time would, then whatever is left is popped.
+
+    Args:
+     arity: children per node in the heap
+
+    Returns:
+     function that runs the workload on a list of keys
+    """
+    def run(collection: MutableSequence) -> None:
+        heap = MaxHeap(arity=arity)
+        for index, key in enumerate(collection):
+            heap.push(key)
+            if index % 2:
+                heap.pop()
+        while heap:
+            heap.pop()
+        return
+    return run
+
+
+def heap_pops(arity: int) -> Callable[[MutableSequence], object]:
+    """Makes a pop-heavy heap workload: push everything then pop it all
+
+    Args:
+     arity: children per node in the heap
+
+    Returns:
+     function that runs the workload on a list of keys
+    """
+    def run(collection: MutableSequence) -> None:
+        queue = IndexedHeap(min_heap=True, arity=arity)
+        for key in collection:
+            queue.push(key)
+        while queue:
+            queue.pop()
+        return
+    return run
+
+
+def heap_decrease_keys(arity: int) -> Callable[[MutableSequence], object]:
+    """Makes a decrease-key-heavy heap workload like Dijkstra's algorithm
+
+    Every key gets pushed, then entries picked by striding through the
+    handles have their keys lowered with a pop after every POP_EVERY
+    updates, then whatever is left gets popped.
+
+    Args:
+     arity: children per node in the heap
+
+    Returns:
+     function that runs the workload on a list of keys
+    """
+    def run(collection: MutableSequence) -> None:
+        queue = IndexedHeap(min_heap=True, arity=arity)
+        handles = [queue.push(key) for key in collection]
+        size = len(handles)
+        for step in range(size * UPDATES_PER_ITEM):
+            handle = handles[(step * UPDATE_STRIDE) % size]
+            if handle in queue:
+                queue.update(handle, queue.key(handle) - 1 - step % 8)
+            if step % POP_EVERY == 0:
+                queue.pop()
+        while queue:
+            queue.pop()
+        return
+    return run
+
+
+def calibrate(collection: MutableSequence) -> None:
+    """A fixed workload that doesn't use bowling, for measuring the machine
+
+    It does a python-level insertion pass over the first thousand
+    items (the kind of loop the sorts here run) and then the built-in
+    sort, so changes to bowling can't make it slower or faster.
+    """
+    head = collection[:1000]
+    for index in range(1, len(head)):
+        item, previous = head[index], index - 1
+        while previous >= 0 and head[previous] > item:
+            head[previous + 1] = head[previous]
+            previous -= 1
+        head[previous + 1] = item
+    collection.sort()
+    return
+
+
+CALIBRATION = Case("calibration", calibrate)
+
+CASES = [
+    Case("bubble", bubble, QUADRATIC_LIMIT),
+    Case("bubba", bubba, QUADRATIC_LIMIT),
+    Case("insertion_sort", insertion_sort, QUADRATIC_LIMIT),
+    Case("binary_insertion_sort", binary_insertion_sort, QUADRATIC_LIMIT),
+    Case("selection_counter", selection_counter, QUADRATIC_LIMIT),
+    Case("shell_sort", shell_sort),
+    Case("mergesort", mergesort),
+    Case("bottom_up_mergesort", bottom_up_mergesort),
+    Case("natural_mergesort", natural_mergesort),
+    Case("introsort", introsort),
+    Case("introsort_three_way", introsort_three_way),
+    Case("introsort_dual_pivot", introsort_dual_pivot),
+    Case("heapsort", heapsort),
+    Case("HeapSort", _heap_sort_class),
+    Case("clrs_partition", _partitioner(clrs_partition)),
+    Case("levitins_partition", _partitioner(levitins_partition)),
+    Case("randomized_partition", _partitioner(
+        partial(randomized_partition, pivot=0,
+                partition=levitins_partition))),
+    Case("three_way_partition", _partitioner(three_way_partition)),
+    Case("dual_pivot_partition", _partitioner(dual_pivot_partition)),
+]
+CASES += [Case(f"max_heap_pops_arity_{arity}", max_heap_pops(arity))
+          for arity in HEAP_ARITIES]
+CASES += [Case(f"max_heap_churn_arity_{arity}", max_heap_churn(arity))
+          for arity in HEAP_ARITIES]
+CASES += [Case(f"heap_pops_arity_{arity}", heap_pops(arity))
+          for arity in HEAP_ARITIES]
+CASES += [Case(f"heap_decrease_keys_arity_{arity}", heap_decrease_keys(arity))
+          for arity in HEAP_ARITIES]
+
+try:
+    import numpy
+    from bowling.sort.radix import radix_sort
+    CASES.append(Case("radix_sort",
+                      lambda collection: radix_sort(numpy.asarray(collection))))
+except ImportError:
+    pass
+
+
+def random_input(size: int, generator: random.Random) -> list:
+    """Shuffled values with few repeats"""
+    return [generator.randrange(size * 10) for _ in range(size)]
+
+
+def sorted_input(size: int, generator: random.Random) -> list:
+    """Values already in order"""
+    return list(range(size))
+
+
+def reversed_input(size: int, generator: random.Random) -> list:
+    """Values in descending order"""
+    return list(range(size, 0, -1))
+
+
+def few_unique_input(size: int, generator: random.Random) -> list:
+    """Shuffled values with only ten distinct keys"""
+    return [generator.randrange(10) for _ in range(size)]
+
+
+def nearly_sorted_input(size: int, generator: random.Random) -> list:
+    """Values in order except for about one percent swapped at random"""
+    values = list(range(size))
+    for _ in range(max(1, size//100)):
+        first, second = generator.randrange(size), generator.randrange(size)
+        values[first], values[second] = values[second], values[first]
+    return values
+
+
+DISTRIBUTIONS = {
+    "random": random_input,
+    "sorted": sorted_input,
+    "reversed": reversed_input,
+    "few_unique": few_unique_input,
+    "nearly_sorted": nearly_sorted_input,
+}
+
+
+def make_input(distribution: str, size: int, seed: int=0) -> list:
+    """Builds one input list
+
+    Args:
+     distribution: key in DISTRIBUTIONS
+     size: number of elements
+     seed: seed for the random generator (so runs get the same inputs)
+
+    Returns:
+     the list of integers
+    """
+    return DISTRIBUTIONS[distribution](size, random.Random(f"{seed}-{size}"))
@@ -0,0 +1,131 @@
+# python
+from pathlib import Path
+from typing import Union
+
+import platform
+import sqlite3
+import subprocess
+
+# this package
+from .runner import Timings
+
+DEFAULT_DATABASE = "benchmarks.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    git_commit TEXT NOT NULL,
+    implementation TEXT NOT NULL,
+    python_version TEXT NOT NULL,
+    created TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS timings (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    algorithm TEXT NOT NULL,
+    distribution TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    seconds REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS timings_run ON timings(run_id);
+"""
+
+
+def git_commit(directory: Union[str, Path]=None) -> str:
+    """The commit the code is at
+
+    Args:
+     directory: somewhere in the repository (default is this package's folder)
+
+    Returns:
+     the commit hash (with "-dirty" if there are uncommitted changes) or "unknown"
+    """
+    directory = directory or Path(__file__).parent
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=directory,
+                                capture_output=True, text=True,
+                                check=True).stdout.strip()
+        changes = subprocess.run(["git", "status", "--porcelain",
+                                  "--untracked-files=no"],
+                                 cwd=directory, capture_output=True,
+                                 text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if changes else commit
+
+
+def connect(path: Union[str, Path]=DEFAULT_DATABASE) -> sqlite3.Connection:
+    """Opens the history database, creating the tables if needed
+
+    Args:
+     path: where the SQLite file is
+
+    Returns:
+     the connection
+    """
+    connection = sqlite3.connect(path)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def save_run(connection: sqlite3.Connection, timings: Timings,
+             commit: str=None) -> int:
+    """Adds a run to the history
+
+    Args:
+     connection: the history database
+     timings: (algorithm, distribution, size): seconds from the runner
+     commit: the commit to file it under (default is the current one)
+
+    Returns:
+     the id of the new run
+    """
+    with connection:
+        cursor = connection.execute(
+            "INSERT INTO runs (git_commit, implementation, python_version) "
+            "VALUES (?, ?, ?)",
+            (commit or git_commit(), platform.python_implementation(),
+             platform.python_version()))
+        run_id = cursor.lastrowid
+        connection.executemany(
+            "INSERT INTO timings VALUES (?, ?, ?, ?, ?)",
+            ((run_id, algorithm, distribution, size, seconds)
+             for (algorithm, distribution, size), times in timings.items()
+             for seconds in times))
+    return run_id
+
+
+def baseline_run(connection: sqlite3.Connection, before: int=None,
+                 implementation: str=None) -> Union[int, None]:
+    """Finds the latest earlier run on the same Python implementation
+
+    Args:
+     connection: the history database
+     before: only look at runs older than this id (default is all of them)
+     implementation: python implementation (default is the one running this)
+
+    Returns:
+     id of the baseline run or None if there isn't one
+    """
+    implementation = implementation or platform.python_implementation()
+    row = connection.execute(
+        "SELECT MAX(id) FROM runs WHERE implementation = ? AND id < ?",
+        (implementation, before if before is not None else 2**63 - 1)).fetchone()
+    return row[0]
+
+
+def load_run(connection: sqlite3.Connection, run_id: int) -> Timings:
+    """Gets the timings for a run
+
+    Args:
+     connection: the history database
+     run_id: which run
+
+    Returns:
+     (algorithm, distribution, size): seconds for each repeat
+    """
+    timings = {}
+    for algorithm, distribution, size, seconds in connection.execute(
+            "SELECT algorithm, distribution, size, seconds FROM timings "
+            "WHERE run_id = ? ORDER BY rowid", (run_id,)):
+        timings.setdefault((algorithm, distribution, size), []).append(seconds)
+    return timings
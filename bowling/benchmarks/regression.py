@@ -0,0 +1,255 @@
+# python
+from collections import Counter
+from collections.abc import Sequence
+from math import comb, erfc, sqrt
+from statistics import median
+
+# pypi
+# https://www.attrs.org/en/stable/index.html
+from attrs import define
+
+# this package
+from .runner import CALIBRATION_KEY, Timings
+
+DEFAULT_ALPHA = 0.01
+DEFAULT_TOLERANCE = 0.05
+DEFAULT_FLOOR = 0.0005
+# past this many repeats in either run the p-value comes from the normal
+# approximation instead of counting arrangements
+EXACT_LIMIT = 20
+
+
+@define
+class Comparison:
+    """How a timing compares to its baseline
+
+    Args:
+     baseline: median seconds in the baseline run
+     current: median seconds in this run
+     ratio: current/baseline
+     p_value: one-sided Mann-Whitney p-value that this run is slower
+     slower: True if the slowdown is significant and bigger than the noise
+    """
+    baseline: float
+    current: float
+    ratio: float
+    p_value: float
+    slower: bool
+
+
+def _arrangements(first: int, second: int, most: int) -> list[int]:
+    """Counts orderings of two samples for each Mann-Whitney U up to most
+
+    The counts are the coefficients of the Gaussian binomial
+    [first + second choose first], which is built up one factor of
+    (1 - q^(second + i))/(1 - q^i) at a time. Each step only looks at
+    smaller powers so everything past most can be left off.
+
+    Args:
+     first, second: sizes of the two samples
+     most: the biggest U to count
+
+    Returns:
+     number of the comb(first + second, first) orderings with each U
+    """
+    counts = [1] + [0] * most
+    for index in range(1, first + 1):
+        for u_statistic in range(most, second + index - 1, -1):
+            counts[u_statistic] -= counts[u_statistic - second - index]
+        for u_statistic in range(index, most + 1):
+            counts[u_statistic] += counts[u_statistic - index]
+    return counts
+
+
+def _normal_p_value(u_statistic: float, baseline: Sequence[float],
+                    current: Sequence[float]) -> float:
+    """The lower tail of U from the normal approximation
+
+    The variance is corrected for ties and the U gets a continuity
+    correction of a half.
+
+    Args:
+     u_statistic: the U from the two samples
+     baseline, current: the samples
+
+    Returns:
+     the p-value
+    """
+    first, second = len(baseline), len(current)
+    total = first + second
+    ties = sum(count**3 - count
+               for count in Counter([*baseline, *current]).values())
+    variance = first * second/12 * (total + 1 - ties/(total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    z_score = (u_statistic + 0.5 - first * second/2)/sqrt(variance)
+    return min(1.0, erfc(-z_score/sqrt(2))/2)
+
+
+def mann_whitney_slower(baseline: Sequence[float],
+                        current: Sequence[float]) -> float:
+    """One-sided Mann-Whitney test that current is slower than baseline
+
+    U counts the (baseline, current) pairs where the baseline took
+    longer (ties count half), so a small U means current is slower.
+    Up to EXACT_LIMIT repeats the p-value is the fraction of all the
+    ways to order the samples that give a U that small or smaller.
+    Past that the counts get too slow to build so the normal
+    approximation is used instead.
+
+    Args:
+     baseline: times from the earlier run
+     current: times from this run
+
+    Returns:
+     the p-value
+    """
+    u_statistic = sum(1.0 if old > new else 0.5 if old == new else 0.0
+                      for old in baseline for new in current)
+    first, second = len(baseline), len(current)
+    if max(first, second) > EXACT_LIMIT:
+        return _normal_p_value(u_statistic, baseline, current)
+    ways = sum(_arrangements(first, second, int(u_statistic)))
+    return ways/comb(first + second, first)
+
+
+def smallest_p_value(first: int, second: int) -> float:
+    """The smallest p-value the exact test can give for two sample sizes
+
+    Args:
+     first, second: sizes of the two samples
+
+    Returns:
+     the p-value when every current time is slower than every baseline time
+    """
+    return 1/comb(first + second, first)
+
+
+def repeats_needed(alpha: float, tests: int=1) -> int:
+    """The fewest repeats (for both runs) that can get a slowdown flagged
+
+    Args:
+     alpha: significance level for the whole family of tests
+     tests: number of cases being compared
+
+    Returns:
+     smallest repeat count whose smallest p-value is within alpha/tests
+    """
+    repeats = 1
+    while smallest_p_value(repeats, repeats) > alpha/tests:
+        repeats += 1
+    return repeats
+
+
+def holm(p_values: Sequence[float], alpha: float=DEFAULT_ALPHA) -> list[bool]:
+    """Holm-Bonferroni correction for testing many cases at once
+
+    The p-values are checked from smallest to largest against
+    alpha/m, alpha/(m - 1), ... and everything before the first one
+    that misses is significant, so the chance of flagging any case by
+    luck stays at alpha however many cases there are.
+
+    Args:
+     p_values: one p-value per case
+     alpha: significance level for the whole family of tests
+
+    Returns:
+     whether each p-value is significant
+    """
+    tests = len(p_values)
+    significant = [False] * tests
+    for rank, index in enumerate(sorted(range(tests),
+                                        key=p_values.__getitem__)):
+        if p_values[index] > alpha/(tests - rank):
+            break
+        significant[index] = True
+    return significant
+
+
+def run_drift(baseline: Timings, current: Timings) -> float:
+    """How much slower the machine is than it was for the baseline
+
+    This is the ratio of the medians of the calibration workload. It
+    doesn't use anything from bowling, so a slowdown in code that every
+    sort uses still shows up in the cases instead of being taken for a
+    slower machine.
+
+    Args:
+     baseline: timings from the earlier run
+     current: timings from this run
+
+    Returns:
+     current/baseline calibration medians (1 if either run doesn't have it)
+    """
+    if CALIBRATION_KEY not in baseline or CALIBRATION_KEY not in current:
+        return 1.0
+    old = median(baseline[CALIBRATION_KEY])
+    return median(current[CALIBRATION_KEY])/old if old else 1.0
+
+
+def compare(baseline: Sequence[float], current: Sequence[float],
+            alpha: float=DEFAULT_ALPHA,
+            tolerance: float=DEFAULT_TOLERANCE,
+            floor: float=DEFAULT_FLOOR, drift: float=1.0) -> Comparison:
+    """Checks if the current timings are a significant slowdown
+
+    The baseline times are scaled up by the drift (if it's more than
+    one) before testing. Besides being significant the median then has
+    to go up by more than the tolerance, by more than the floor (so
+    microsecond cases don't get flagged for scheduler jitter) and by
+    more than the spread of the baseline times (so noisy cases need a
+    bigger change).
+
+    Args:
+     baseline: times from the earlier run
+     current: times from this run
+     alpha: significance level for the test
+     tolerance: fraction slower the median has to be to count
+     floor: seconds slower the median has to be to count
+     drift: how much slower the machine is than for the baseline
+
+    Returns:
+     the comparison (the baseline and ratio are the unscaled ones)
+    """
+    old, new = median(baseline), median(current)
+    ratio = new/old if old else float("inf")
+    scaled = [seconds * max(drift, 1.0) for seconds in baseline]
+    expected = median(scaled)
+    p_value = mann_whitney_slower(scaled, current)
+    noise = max(tolerance * expected, floor, max(scaled) - min(scaled))
+    return Comparison(baseline=old, current=new, ratio=ratio,
+                      p_value=p_value,
+                      slower=p_value <= alpha and new - expected > noise)
+
+
+def compare_runs(baseline: Timings, current: Timings,
+                 alpha: float=DEFAULT_ALPHA,
+                 tolerance: float=DEFAULT_TOLERANCE,
+                 floor: float=DEFAULT_FLOOR) -> dict:
+    """Compares every case the two runs share
+
+    Each case is compared on its own (allowing for the drift of the
+    machine) and then only the ones that are still significant after
+    the Holm correction stay flagged. The calibration workload isn't
+    one of the cases.
+
+    Args:
+     baseline: timings from the earlier run
+     current: timings from this run
+     alpha: significance level for the whole run
+     tolerance: fraction slower a median has to be to count
+     floor: seconds slower a median has to be to count
+
+    Returns:
+     (case name, distribution, size): comparison, for the shared cases
+    """
+    drift = run_drift(baseline, current)
+    comparisons = {key: compare(baseline[key], seconds, alpha, tolerance,
+                                floor, drift)
+                   for key, seconds in current.items()
+                   if key in baseline and key != CALIBRATION_KEY}
+    significant = holm([comparison.p_value
+                        for comparison in comparisons.values()], alpha)
+    for comparison, passed in zip(comparisons.values(), significant):
+        comparison.slower = comparison.slower and passed
+    return comparisons
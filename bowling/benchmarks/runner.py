@@ -0,0 +1,83 @@
+# python
+from collections.abc import Iterable
+from time import perf_counter
+
+# this package
+from .cases import CALIBRATION, CASES, Case, make_input
+
+DEFAULT_SIZES = (100, 1000, 10000)
+DEFAULT_REPEATS = 8
+MAX_REPEATS = 1000
+CALIBRATION_SIZE = 10000
+CALIBRATION_KEY = (CALIBRATION.name, "random", CALIBRATION_SIZE)
+
+Timings = dict[tuple[str, str, int], list[float]]
+
+
+def time_case(case: Case, values: list, repeats: int=DEFAULT_REPEATS) -> list[float]:
+    """Times one case on one input
+
+    Each repeat gets a fresh copy of the input (the copy isn't timed)
+    so the in-place sorts don't end up sorting sorted input.
+
+    Args:
+     case: the thing to time
+     values: the input
+     repeats: how many times to run it
+
+    Returns:
+     seconds for each repeat
+    """
+    seconds = []
+    for _ in range(repeats):
+        collection = list(values)
+        started = perf_counter()
+        case.run(collection)
+        seconds.append(perf_counter() - started)
+    return seconds
+
+
+def run_benchmarks(cases: Iterable[Case]=CASES,
+                   distributions: Iterable[str]=("random",),
+                   sizes: Iterable[int]=DEFAULT_SIZES,
+                   repeats: int=DEFAULT_REPEATS,
+                   seed: int=0, calibrate: bool=True) -> Timings:
+    """Times every case on every distribution and size
+
+    Cases are skipped for sizes bigger than their ~largest~. The
+    repeats are done in rounds (every case once, then every case
+    again) rather than all of one case's repeats back to back, so a
+    burst of load from something else on the machine adds a little
+    noise to many cases instead of making one case look slower.
+
+    Every round also times the calibration workload (under
+    CALIBRATION_KEY) so runs on a busier or slower machine can be
+    told apart from slower code.
+
+    Args:
+     cases: what to time
+     distributions: names of the input distributions to use
+     sizes: input sizes
+     repeats: runs for each case, distribution and size
+     seed: seed for building the inputs
+     calibrate: time the calibration workload too
+
+    Returns:
+     (case name, distribution, size): seconds for each repeat
+    """
+    cases, distributions, sizes = list(cases), list(distributions), list(sizes)
+    inputs = {(distribution, size): make_input(distribution, size, seed)
+              for distribution in distributions for size in sizes}
+    calibration_input = make_input("random", CALIBRATION_SIZE, seed)
+    timings = {}
+    for _ in range(repeats):
+        if calibrate:
+            timings.setdefault(CALIBRATION_KEY, []).extend(
+                time_case(CALIBRATION, calibration_input, repeats=1))
+        for (distribution, size), values in inputs.items():
+            for case in cases:
+                if case.largest is not None and size > case.largest:
+                    continue
+                timings.setdefault((case.name, distribution, size), []).extend(
+                    time_case(case, values, repeats=1))
+    return timings
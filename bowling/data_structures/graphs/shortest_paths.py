@@ -3,6 +3,9 @@ from __future__ import annotations
 from collections import defaultdict
 from dataclasses import dataclass, field
 
+# this project
+from bowling.data_structures.heap import IndexedHeap
+
 INFINITE = INFINITY = float("inf")
 
 
@@ -89,3 +92,31 @@ def relax(edge: Edge) -> None:
         edge.target.path_estimate = edge.source.path_estimate + edge.weight
         edge.target.predecessor = edge.source
     return
+
+
+def dijkstras_shortest_paths(graph: Graph, source: Vertex) -> None:
+    """Find the shortest paths beginning at the source
+
+    The vertices go in a min-heap keyed by their path estimates and
+    whenever relaxing an edge lowers a vertex's estimate its entry is
+    updated through its handle, so every vertex is in the queue once
+    and comes out with its final estimate.
+
+    Args:
+     graph: the vertices and edges to use (weights can't be negative)
+     source: the starting vertex for the paths
+    """
+    initialize_single_source(graph, source)
+    queue = IndexedHeap(min_heap=True)
+    handles = {vertex: queue.push(vertex.path_estimate, vertex)
+               for vertex in graph.vertices}
+    while queue:
+        _, vertex = queue.pop()
+        for edge in graph.adjacent[vertex]:
+            estimate = edge.target.path_estimate
+            relax(edge)
+            if (edge.target.path_estimate < estimate
+                    and handles[edge.target] in queue):
+                queue.update(handles[edge.target],
+                             edge.target.path_estimate)
+    return
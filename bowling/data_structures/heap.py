@@ -1,6 +1,13 @@
+# python
+from collections.abc import Callable, Iterable
+
+import operator
+
 # pypi
 # https://www.attrs.org/en/stable/index.html
-from attrs import define
+from attrs import define, field
+
+BINARY = 2
 
 
 @define
@@ -10,25 +17,53 @@ class MaxHeap:
     If you pass in the heap as a list pre-pend it with Infinity
 
     Otherwise use ~heap = MaxHeap.from_list(elements)~ to build it
+
+    As a priority queue use ~push~, ~pop~, ~peek~, ~pushpop~, ~replace~
+    and ~push_many~ - these keep the heap property as they go so the
+    heap only needs to be built (called) once.
+
+    With an arity of d each node has d children, the children of node i
+    are at d(i - 1) + 2 through di + 1 and its parent is at
+    (i - 2)//d + 1 (with d=2 these are the usual 2i, 2i + 1 and i//2).
+    Wider heaps are shallower so pushes and increases are cheaper while
+    pops compare more children per level (but they sit side by side).
+
+    Args:
+     heap: list with the padding in the first cell and the items after it
+     size: how much of the list is in the heap (default is all of it)
+     check: check the heap property after every change (slow, for debugging)
+     arity: number of children each node has
+
+    Raises:
+     ValueError: the arity is less than 2
     """
     INFINITY = float("inf")
     NEGATIVE_INFINITY = -INFINITY
     ROOT_NODE = 1
 
-    heap: list = [INFINITY]
+    heap: list = field(factory=lambda: [MaxHeap.INFINITY])
     _size: int = None
+    check: bool = False
+    arity: int = BINARY
+
+    def __attrs_post_init__(self) -> None:
+        if self.arity < BINARY:
+            raise ValueError(f"A heap needs an arity of at least 2, not {self.arity}")
+        return
 
     @classmethod
-    def from_list(cls, heap: list):
+    def from_list(cls, heap: list, check: bool=False, arity: int=BINARY):
         """Builds a max-heap instance from the starter list
     
         Args:
          heap: list of elements to dump on the heap
-        
+         check: check the heap property after every change
+         arity: number of children each node has
+    
         Returns:
          MaxHeap instance with the heap list added
         """
-        return cls(heap = [cls.INFINITY] + heap)
+        return cls(heap = [cls.INFINITY] + heap, check=check, arity=arity)
 
     @property
     def size(self) -> int:
@@ -40,7 +75,7 @@ class MaxHeap:
     @size.setter
     def size(self, new_size) -> int:
         """Set the size of the max heap
-        
+    
         Args:
          new_size: how much of the list is in the heap
     
@@ -67,14 +102,14 @@ class MaxHeap:
 
     def parent(self, node: int) -> int:
         """Find the parent of a node
-        
+    
         Args:
          node: the index of the node to check
     
         Returns:
          the index of the parent of the node
         """
-        return node//2
+        return (node - 2)//self.arity + 1
 
     def left_child(self, parent: int) -> int:
         """Find the left child of a parent
@@ -85,10 +120,10 @@ class MaxHeap:
         Returns:
          index of the left child of the parent
         """
-        return 2 * parent
+        return self.arity * (parent - 1) + 2
 
     def right_child(self, parent: int) -> int:
-        """Find the right child of a parent
+        """Find the right (last) child of a parent
     
         Args:
          parent: the index of the parent node
@@ -96,33 +131,56 @@ class MaxHeap:
         Returns:
          index of the right child of the parent
         """
-        return 2 * parent + 1
+        return self.arity * parent + 1
 
     def heapify_subtree(self, node: int):
         """Heapify the tree rooted at the node
-        
+    
         Args:
          node: index of the node to compare to its descendants
         """
-        left, right = self.left_child(node), self.right_child(node)
-        largest = node
-        
-        if left <= self.size and self.heap[left] > self.heap[largest]:
-            # the left child was larger than the current parent node
-            largest = left
+        self._sift_down(node)
+        return
+
+    def _sift_down(self, node: int) -> None:
+        """Moves the item at the node down until it's no smaller than its children
     
-        if right <= self.size and self.heap[right] > self.heap[largest]:
-            # the right child is larger than the left and the current parent
-            largest = right
+        Instead of swapping at every level the item is held out and the
+        largest child is moved up into the hole until the item fits.
     
-        if largest != node:
-            # the current parent is out of place, swap it
-            self.heap[node], self.heap[largest] = (self.heap[largest],
-                                                   self.heap[node])
+        Args:
+         node: index of the item to move down
+        """
+        heap, size, arity = self.heap, self.size, self.arity
+        item = heap[node]
+        child = arity * (node - 1) + 2
+        while child <= size:
+            if arity == BINARY:
+                if child < size and heap[child] < heap[child + 1]:
+                    child += 1
+            else:
+                child = max(range(child, min(child + arity, size + 1)),
+                            key=heap.__getitem__)
+            if not item < heap[child]:
+                break
+            heap[node] = heap[child]
+            node, child = child, arity * (child - 1) + 2
+        heap[node] = item
+        return
+
+    def _sift_up(self, node: int) -> None:
+        """Moves the item at the node up until it's no bigger than its parent
     
-            # after the swap the item at "largest" is the "node" we started with
-            # so try it again
-            self.heapify_subtree(largest)
+        Args:
+         node: index of the item to move up
+        """
+        heap, arity = self.heap, self.arity
+        item = heap[node]
+        parent = (node - 2)//arity + 1
+        while node > 1 and heap[parent] < item:
+            heap[node] = heap[parent]
+            node, parent = parent, (parent - 2)//arity + 1
+        heap[node] = item
         return
 
     def increase_key(self, node, key):
@@ -135,14 +193,11 @@ class MaxHeap:
         Raises:
          AssertionError if new value isn't larger than the previous value
         """
-        assert key > self.heap[node], (f"{key} not greater than previous value {self.heap.node}")
+        assert key > self.heap[node], (f"{key} not greater than previous value {self.heap[node]}")
         self.heap[node] = key
-    
-        while (node > self.ROOT_NODE and
-               self.heap[self.parent(node)] < self.heap[node]):
-            self.heap[node], self.heap[self.parent(node)] = (
-                self.heap[self.parent(node)], self.heap[node])
-            node = self.parent(node)
+        self._sift_up(node)
+        if self.check:
+            self.check_rep()
         return
 
     def insert(self, key):
@@ -151,21 +206,128 @@ class MaxHeap:
         Args:
          key: orderable item to insert into the heap
         """
-        self.size += 1
-        self.heap[self.size - 1] = self.NEGATIVE_INFINITY
-        self.increase_key(self.size - 1, key)
+        self.push(key)
+        return
+
+    def push(self, key) -> None:
+        """Adds the key to the heap
+    
+        Args:
+         key: orderable item to add
+        """
+        node = self.size + 1
+        if node < len(self.heap):
+            self.heap[node] = key
+        else:
+            self.heap.append(key)
+        self._size = node
+        self._sift_up(node)
+        if self.check:
+            self.check_rep()
+        return
+
+    def push_many(self, keys: Iterable) -> None:
+        """Adds all the keys to the heap
+    
+        If there are more new keys than keys already in the heap they're
+        all put at the end and the whole heap is rebuilt bottom-up (O(n)),
+        otherwise they're pushed one at a time.
+    
+        Args:
+         keys: orderable items to add
+        """
+        keys = list(keys)
+        if len(keys) <= self.size:
+            for key in keys:
+                self.push(key)
+            return
+    
+        del self.heap[self.size + 1:]
+        self.heap.extend(keys)
+        self._size = len(self.heap) - 1
+        self()
         return
 
+    def peek(self):
+        """The largest key (without removing it)
+    
+        Raises:
+         IndexError: the heap is empty
+        """
+        if self.size < 1:
+            raise IndexError("peek at an empty heap")
+        return self.heap[self.ROOT_NODE]
+
+    def pop(self):
+        """Removes and returns the largest key
+    
+        Raises:
+         IndexError: the heap is empty
+        """
+        heap, size = self.heap, self.size
+        if size < 1:
+            raise IndexError("pop from an empty heap")
+        largest, last = heap[self.ROOT_NODE], heap[size]
+        if size == len(heap) - 1:
+            heap.pop()
+        self._size = size - 1
+        if size > 1:
+            heap[self.ROOT_NODE] = last
+            self._sift_down(self.ROOT_NODE)
+        if self.check:
+            self.check_rep()
+        return largest
+
+    def pushpop(self, key):
+        """Pushes the key then pops the largest key (faster than doing both)
+    
+        Args:
+         key: orderable item to add
+    
+        Returns:
+         the larger of the key and the heap's largest key
+        """
+        heap = self.heap
+        if self.size and key < heap[self.ROOT_NODE]:
+            key, heap[self.ROOT_NODE] = heap[self.ROOT_NODE], key
+            self._sift_down(self.ROOT_NODE)
+            if self.check:
+                self.check_rep()
+        return key
+
+    def replace(self, key):
+        """Pops the largest key then pushes the new key (faster than doing both)
+    
+        Unlike ~pushpop~ the largest key in the heap is returned even if
+        the new key is bigger.
+    
+        Args:
+         key: orderable item to add
+    
+        Returns:
+         the largest key before the new key was added
+    
+        Raises:
+         IndexError: the heap is empty
+        """
+        largest = self.peek()
+        self.heap[self.ROOT_NODE] = key
+        self._sift_down(self.ROOT_NODE)
+        if self.check:
+            self.check_rep()
+        return largest
+
     def __call__(self):
         """Heapifies the heap
     
         Raises:
-         AssertionError: something bad happened and the Heap Property failed
+         AssertionError: check is on and the Heap Property failed
         """
-        for parent in reversed(range(1, self.size//2 + 1)):
-            self.heapify_subtree(parent)
+        for parent in reversed(range(1, (self.size - 2)//self.arity + 2)):
+            self._sift_down(parent)
     
-        self.check_rep()
+        if self.check:
+            self.check_rep()
         return
 
     def check_rep(self) -> None:
@@ -174,16 +336,21 @@ class MaxHeap:
         Raises:
          AssertionError: the heap property has been violated
         """
-        for node in range(1, self.size):
-            assert self.heap[self.parent(node)] >= self.heap[node], (
-                f"Parent node {self.parent(node)} = {self.heap[self.parent(node)]} "
+        for node in range(2, self.size + 1):
+            parent = self.parent(node)
+            assert self.heap[parent] >= self.heap[node], (
+                f"Parent node {parent} = {self.heap[parent]} "
                 f"not >= {node}={self.heap[node]}")
         return
 
+    def __len__(self) -> int:
+        """The number of keys in the heap"""
+        return self.size
+
     def __getitem__(self, node: int):
         """Gets an item from the heap
-            
-        Args: 
+    
+        Args:
          node: index of the heap to get the value
         """
         return self.heap[node]
@@ -197,3 +364,222 @@ class MaxHeap:
         """
         self.heap[node] = value
         return
+
+
+Handle = int
+
+
+@define
+class IndexedHeap:
+    """A priority queue whose entries can be found again by handle
+
+    ~push~ hands back a handle for the entry and the heap keeps a map
+    from each handle to where its entry currently sits, so an entry's
+    key can be changed (~update~) or the entry taken out (~remove~) in
+    O(log n) without a search and without leaving stale duplicates
+    behind. The keys and handles are kept in parallel 1-indexed lists
+    laid out like the MaxHeap (including its arity).
+
+    Args:
+     min_heap: put the smallest key on top instead of the largest (for Dijkstra's algorithm)
+     check: check the heap property after every change (slow, for debugging)
+     arity: number of children each node has
+
+    Raises:
+     ValueError: the arity is less than 2
+    """
+    min_heap: bool = False
+    check: bool = False
+    arity: int = BINARY
+    keys: list = field(factory=lambda: [None])
+    handles: list = field(factory=lambda: [None])
+    positions: dict = field(factory=dict)
+    items: dict = field(factory=dict)
+    _next_handle: int = field(init=False, default=0)
+    _higher: Callable = field(init=False, default=None)
+
+    def __attrs_post_init__(self) -> None:
+        if self.arity < BINARY:
+            raise ValueError(f"A heap needs an arity of at least 2, not {self.arity}")
+        self._higher = operator.lt if self.min_heap else operator.gt
+        return
+
+    def __len__(self) -> int:
+        """The number of entries in the heap"""
+        return len(self.keys) - 1
+    
+    def __contains__(self, handle: Handle) -> bool:
+        """Checks if the entry for the handle is still in the heap"""
+        return handle in self.positions
+    
+    def contains(self, handle: Handle) -> bool:
+        """Checks if the entry for the handle is still in the heap
+    
+        Args:
+         handle: what push returned for the entry
+    
+        Returns:
+         True if it hasn't been popped or removed
+        """
+        return handle in self.positions
+    
+    def key(self, handle: Handle):
+        """The current key for the handle's entry
+    
+        Raises:
+         KeyError: the entry isn't in the heap
+        """
+        return self.keys[self.positions[handle]]
+
+    def push(self, key, item=None) -> Handle:
+        """Adds an entry to the heap
+    
+        Args:
+         key: orderable priority of the entry
+         item: whatever the entry is for
+    
+        Returns:
+         handle to use with update, remove and contains
+        """
+        handle = self._next_handle
+        self._next_handle += 1
+        self.keys.append(key)
+        self.handles.append(handle)
+        self.items[handle] = item
+        node = len(self.keys) - 1
+        self.positions[handle] = node
+        self._sift_up(node)
+        if self.check:
+            self.check_rep()
+        return handle
+    
+    def peek(self) -> tuple:
+        """The (key, item) on top of the heap (without removing it)
+    
+        Raises:
+         IndexError: the heap is empty
+        """
+        if len(self.keys) < 2:
+            raise IndexError("peek at an empty heap")
+        return self.keys[1], self.items[self.handles[1]]
+    
+    def pop(self) -> tuple:
+        """Removes the entry on top of the heap
+    
+        Returns:
+         (key, item) of the entry
+    
+        Raises:
+         IndexError: the heap is empty
+        """
+        if len(self.keys) < 2:
+            raise IndexError("pop from an empty heap")
+        return self.remove(self.handles[1])
+
+    def update(self, handle: Handle, key) -> None:
+        """Changes the key of an entry (either way) and moves it to its new place
+    
+        Args:
+         handle: what push returned for the entry
+         key: the new key
+    
+        Raises:
+         KeyError: the entry isn't in the heap
+        """
+        node = self.positions[handle]
+        old_key, self.keys[node] = self.keys[node], key
+        if self._higher(key, old_key):
+            self._sift_up(node)
+        else:
+            self._sift_down(node)
+        if self.check:
+            self.check_rep()
+        return
+    
+    def remove(self, handle: Handle) -> tuple:
+        """Takes an entry out of the heap
+    
+        Args:
+         handle: what push returned for the entry
+    
+        Returns:
+         (key, item) of the entry
+    
+        Raises:
+         KeyError: the entry isn't in the heap
+        """
+        node = self.positions.pop(handle)
+        key, item = self.keys[node], self.items.pop(handle)
+        last_key, last_handle = self.keys.pop(), self.handles.pop()
+        if node < len(self.keys):
+            self.keys[node], self.handles[node] = last_key, last_handle
+            self.positions[last_handle] = node
+            parent = (node - 2)//self.arity + 1
+            if node > 1 and self._higher(last_key, self.keys[parent]):
+                self._sift_up(node)
+            else:
+                self._sift_down(node)
+        if self.check:
+            self.check_rep()
+        return key, item
+
+    def _sift_up(self, node: int) -> None:
+        """Moves the entry at the node up until its parent is no lower
+    
+        Args:
+         node: index of the entry to move
+        """
+        keys, handles, positions = self.keys, self.handles, self.positions
+        higher, arity = self._higher, self.arity
+        key, handle = keys[node], handles[node]
+        parent = (node - 2)//arity + 1
+        while node > 1 and higher(key, keys[parent]):
+            keys[node], handles[node] = keys[parent], handles[parent]
+            positions[handles[node]] = node
+            node, parent = parent, (parent - 2)//arity + 1
+        keys[node], handles[node] = key, handle
+        positions[handle] = node
+        return
+    
+    def _sift_down(self, node: int) -> None:
+        """Moves the entry at the node down until no child is higher
+    
+        Args:
+         node: index of the entry to move
+        """
+        keys, handles, positions = self.keys, self.handles, self.positions
+        higher, arity = self._higher, self.arity
+        size = len(keys) - 1
+        key, handle = keys[node], handles[node]
+        child = arity * (node - 1) + 2
+        while child <= size:
+            best = child
+            for other in range(child + 1, min(child + arity, size + 1)):
+                if higher(keys[other], keys[best]):
+                    best = other
+            child = best
+            if not higher(keys[child], key):
+                break
+            keys[node], handles[node] = keys[child], handles[child]
+            positions[handles[node]] = node
+            node, child = child, arity * (child - 1) + 2
+        keys[node], handles[node] = key, handle
+        positions[handle] = node
+        return
+
+    def check_rep(self) -> None:
+        """Checks the heap property and the handle map
+    
+        Raises:
+         AssertionError: a child is higher than its parent or a handle is lost
+        """
+        for node in range(2, len(self.keys)):
+            parent = (node - 2)//self.arity + 1
+            assert not self._higher(self.keys[node], self.keys[parent]), (
+                f"Child {node}={self.keys[node]} is higher than its parent "
+                f"{parent}={self.keys[parent]}")
+        for node in range(1, len(self.keys)):
+            assert self.positions[self.handles[node]] == node, (
+                f"Handle {self.handles[node]} isn't mapped to {node}")
+        assert len(self.positions) == len(self.keys) - 1
+        return
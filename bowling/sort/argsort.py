@@ -0,0 +1,123 @@
+# python
+from array import array
+from collections.abc import Callable, Sequence
+from operator import itemgetter
+
+# pypi
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# this project
+from bowling.sort.heap import heapsort
+from bowling.sort.merge import natural_mergesort
+from bowling.sort.quick import introsort
+
+INDEX_TYPE = "q"
+
+
+def _argsort(sort: Callable, collection: Sequence, key: Callable,
+             reverse: bool):
+    """Sorts the indices of the collection by the values they point to
+
+    The sort's own ~key~ argument caches the values (or their keys) once
+    and breaks ties by index, so the result is stable whichever sort is
+    used and the collection is only read, never changed.
+
+    Args:
+     sort: one of the keyed in-place sorts
+     collection: the values to order
+     key: function to get the value to compare (default is the value)
+     reverse: order from largest to smallest
+
+    Returns:
+     the permutation, as a NumPy array if the collection is one, otherwise array('q')
+    """
+    get = collection.__getitem__
+    indices = list(range(len(collection)))
+    sort(indices, key=get if key is None else lambda index: key(get(index)),
+         reverse=reverse)
+    if numpy is not None and isinstance(collection, numpy.ndarray):
+        return numpy.array(indices, dtype=numpy.intp)
+    return array(INDEX_TYPE, indices)
+
+
+def merge_argsort(collection: Sequence, key: Callable=None,
+                  reverse: bool=False):
+    """Indices that would sort the collection, using natural mergesort
+
+    Args:
+     collection: the values to order
+     key: function to get the value to compare (default is the value)
+     reverse: order from largest to smallest (equal values keep their order)
+
+    Returns:
+     the permutation, as a NumPy array if the collection is one, otherwise array('q')
+    """
+    return _argsort(natural_mergesort, collection, key, reverse)
+
+
+def quick_argsort(collection: Sequence, quicksort: Callable=introsort,
+                  key: Callable=None, reverse: bool=False):
+    """Indices that would sort the collection, using one of the quicksorts
+
+    Args:
+     collection: the values to order
+     quicksort: introsort, introsort_three_way or introsort_dual_pivot
+     key: function to get the value to compare (default is the value)
+     reverse: order from largest to smallest (equal values keep their order)
+
+    Returns:
+     the permutation, as a NumPy array if the collection is one, otherwise array('q')
+    """
+    return _argsort(quicksort, collection, key, reverse)
+
+
+def heap_argsort(collection: Sequence, key: Callable=None,
+                 reverse: bool=False):
+    """Indices that would sort the collection, using heapsort
+
+    Args:
+     collection: the values to order
+     key: function to get the value to compare (default is the value)
+     reverse: order from largest to smallest (equal values keep their order)
+
+    Returns:
+     the permutation, as a NumPy array if the collection is one, otherwise array('q')
+    """
+    return _argsort(heapsort, collection, key, reverse)
+
+
+def apply_permutation(permutation: Sequence[int], *columns: Sequence) -> list:
+    """Reorders parallel columns by the same permutation
+
+    The permutation is turned into a single itemgetter which is then
+    run over each column, so picking out the items happens in C and the
+    permutation is only walked once to build the getter. NumPy columns
+    are indexed with the permutation directly.
+
+    Args:
+     permutation: new order, as indices into the columns (e.g. from an argsort)
+     columns: equal-length sequences to reorder
+
+    Returns:
+     new columns in the same order (lists, or the column's type for array.array and NumPy arrays)
+    """
+    indices = list(permutation)
+    if len(indices) == 1:
+        getter = lambda column: (column[indices[0]],)
+    elif indices:
+        getter = itemgetter(*indices)
+    else:
+        getter = lambda column: ()
+
+    reordered = []
+    for column in columns:
+        if numpy is not None and isinstance(column, numpy.ndarray):
+            reordered.append(column[numpy.asarray(indices, dtype=numpy.intp)])
+        elif isinstance(column, array):
+            reordered.append(array(column.typecode, getter(column)))
+        else:
+            reordered.append(list(getter(column)))
+    return reordered
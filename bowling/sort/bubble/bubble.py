@@ -2,6 +2,11 @@
 from collections.abc import MutableSequence
 from collections import namedtuple
 
+# this project
+from bowling.sort import kernels
+from bowling.sort.keys import keyed
+from bowling.sort.trace import SwapTrace
+
 ElementCount = int
 ComparisonCount = int
 SwapCount = int
@@ -9,10 +14,6 @@ SortedElements = MutableSequence
 
 Counts = tuple[ElementCount, ComparisonCount, SwapCount, SortedElements]
 
-IndexHistory = list[int]
-ElementValue = int
-
-Swaps = dict[ElementValue, IndexHistory]
 BubbleOutput = namedtuple("BubbleOutput",
                           [
                               "element_count", "comparisons",
@@ -20,6 +21,7 @@ BubbleOutput = namedtuple("BubbleOutput",
                               "elements"])
 
 
+@keyed
 def bubba(elements: MutableSequence) -> Counts:
     """Sorts the list in place and tracks the number of comparisons
 
@@ -34,6 +36,10 @@ def bubba(elements: MutableSequence) -> Counts:
     Returns:
      number of elements, count of comparisons, count of swaps elements
     """
+    if kernels.use_kernel(elements):
+        comparisons, swaps = kernels.bubba(elements)
+        return BubbleOutput(len(elements), comparisons, swaps, elements)
+
     all_but_one = len(elements) - 1
     comparisons = swaps = 0
     for items_sorted in range(all_but_one):
@@ -49,9 +55,10 @@ def bubba(elements: MutableSequence) -> Counts:
                 swapped_at_least_once = True
         if not swapped_at_least_once:
             break
-    return (len(elements), comparisons, swaps, elements)
+    return BubbleOutput(len(elements), comparisons, swaps, elements)
 
 
+@keyed
 def bubble(elements: MutableSequence) -> Counts:
     """Sorts the list in place
 
@@ -61,6 +68,10 @@ def bubble(elements: MutableSequence) -> Counts:
     Returns:
      number of elements, count of comparisons, count of swaps, sorted elements
     """
+    if kernels.use_kernel(elements):
+        comparisons, swaps = kernels.bubble(elements)
+        return BubbleOutput(len(elements), comparisons, swaps, elements)
+
     all_but_one = len(elements) - 1
     comparisons = swaps = 0
     for items_sorted in range(all_but_one):
@@ -75,18 +86,23 @@ def bubble(elements: MutableSequence) -> Counts:
     return BubbleOutput(len(elements), comparisons, swaps, elements)
 
 
-def swap_tracker(elements: MutableSequence) -> Swaps:
-    """Does the bubble-sort and tracks the locations
+def swap_tracker(elements: MutableSequence,
+                 trace: SwapTrace=None) -> SwapTrace:
+    """Does the bubble-sort and records the swaps
+
+    Use ~trace.histories()~ to get the index history of every element
+    (this used to be what the function returned).
 
     Args:
      elements: list of orderable items
+     trace: where to record the swaps (default is a new in-memory trace)
 
     Returns:
-     dict of element value: list of indices it was at during sort
+     the trace of (i, j) index pairs that were swapped
     """
     all_but_one = len(elements) - 1
-
-    swaps = {element: [index] for index, element in enumerate(elements)}
+    if trace is None:
+        trace = SwapTrace(len(elements))
 
     for items_sorted in range(all_but_one):
         for in_front_of_us in range(all_but_one - items_sorted):
@@ -95,6 +111,6 @@ def swap_tracker(elements: MutableSequence) -> Swaps:
                 (elements[in_front_of_us],
                  elements[to_the_right]) = (elements[to_the_right],
                                             elements[in_front_of_us])
-                for index, element in enumerate(elements):
-                    swaps[element].append(index)
-    return swaps
+                trace.record(in_front_of_us, to_the_right)
+    trace.flush()
+    return trace
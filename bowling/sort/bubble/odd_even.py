@@ -0,0 +1,83 @@
+# python
+from collections.abc import MutableSequence
+from typing import Union
+
+# pypi
+import numpy
+
+# this project
+from bowling.sort.inversions import (bubba_comparisons, bubba_stats,
+                                     bubble_comparisons, bubble_passes,
+                                     bubble_stats)
+
+# this package
+from .bubble import BubbleOutput
+
+
+def odd_even_stats(values: numpy.ndarray,
+                   early_exit: bool=False) -> BubbleOutput:
+    """Predicts what bubble (or bubba) would count without sorting
+
+    This is ~bubble_stats~ (or ~bubba_stats~) on the array, which count
+    arrays with vectorized merge levels instead of python loops.
+
+    Args:
+     values: 1-D array of orderable values (not changed)
+     early_exit: count like bubba instead of bubble
+
+    Returns:
+     number of values, comparisons, swaps, the (unsorted) values
+    """
+    values = numpy.asarray(values)
+    return bubba_stats(values) if early_exit else bubble_stats(values)
+
+
+def odd_even_sort(elements: Union[numpy.ndarray, MutableSequence],
+                  early_exit: bool=False) -> BubbleOutput:
+    """Sorts the array in place with odd-even transposition sort
+
+    Each phase compares every (even, odd) or every (odd, even) pair of
+    neighbors at once and swaps the ones that are out of order with
+    one ~numpy.minimum~ and one ~numpy.maximum~, and the phases
+    alternate until two in a row don't swap anything. Like bubble sort
+    every swap fixes one inversion, so the swap count is the same as
+    bubble's, and the comparisons are the ones bubble (or bubba) would
+    make, not the ones the phases make. It still takes up to n phases,
+    so for just the counts of a big array use ~odd_even_stats~. Anything
+    that isn't an array (like a list) is sorted as a copy made with
+    ~numpy.asarray~ and then the sorted values are written back into it.
+
+    Warning:
+     NaNs spread through ~numpy.minimum~ and ~numpy.maximum~ so arrays with NaNs won't be sorted
+
+    Args:
+     elements: 1-D array (or list) of orderable values
+     early_exit: count comparisons like bubba instead of bubble
+
+    Returns:
+     number of elements, comparisons, swaps, sorted elements
+    """
+    array = numpy.asarray(elements)
+    items = len(array)
+    comparisons = (bubba_comparisons(items, bubble_passes(array))
+                   if early_exit else bubble_comparisons(items))
+    swaps = quiet_phases = 0
+    start = 0
+    while quiet_phases < 2 and items > 1:
+        pairs = (items - start)//2
+        lows = array[start:start + 2 * pairs:2]
+        highs = array[start + 1:start + 2 * pairs:2]
+        swapped = int(numpy.count_nonzero(highs < lows))
+        if swapped:
+            smaller = numpy.minimum(lows, highs)
+            numpy.maximum(lows, highs, out=highs)
+            lows[...] = smaller
+            swaps += swapped
+            quiet_phases = 0
+        else:
+            quiet_phases += 1
+        start = 1 - start
+
+    if array is not elements:
+        elements[:] = array.tolist()
+    return BubbleOutput(items, comparisons, swaps, elements)
@@ -1,40 +1,144 @@
+# python
+from collections import namedtuple
+from collections.abc import MutableSequence
+
 # pypi
 # https://www.attrs.org/en/stable/index.html
 from attrs import define
 
 # this project
-from bowling.data_structures.heap import MaxHeap
+from bowling.sort.keys import keyed
+
+HeapSortOutput = namedtuple("HeapSortOutput", ["element_count",
+                                               "comparisons",
+                                               "swaps",
+                                               "elements"])
+
+
+def sift_down(elements: MutableSequence, left: int, node: int,
+              last: int) -> tuple[int, int]:
+    """Moves the node down until the max-heap rooted at left is restored
+
+    The heap is stored zero-based in elements[left:last + 1] so the
+    children of the node at offset k are at offsets 2k + 1 and 2k + 2.
+
+    Args:
+     elements: collection holding the heap
+     left: index of the root of the heap
+     node: index of the node to sift down
+     last: index of the last element in the heap
+
+    Returns:
+     count of comparisons, count of swaps
+    """
+    comparisons = swaps = 0
+    child = left + 2 * (node - left) + 1
+    while child <= last:
+        if child < last:
+            comparisons += 1
+            if elements[child] < elements[child + 1]:
+                child += 1
+
+        comparisons += 1
+        if not elements[node] < elements[child]:
+            break
+
+        elements[node], elements[child] = elements[child], elements[node]
+        swaps += 1
+        node = child
+        child = left + 2 * (node - left) + 1
+    return comparisons, swaps
+
+
+def check_heap(elements: MutableSequence, left: int, last: int) -> None:
+    """Checks the max-heap property of the heap in elements[left:last + 1]
+
+    Args:
+     elements: collection holding the heap
+     left: index of the root of the heap
+     last: index of the last element in the heap
+
+    Raises:
+     AssertionError: a node is smaller than one of its children
+    """
+    for node in range(left + 1, last + 1):
+        parent = left + (node - left - 1)//2
+        assert not elements[parent] < elements[node], (
+            f"Parent {parent}={elements[parent]} < child {node}={elements[node]}")
+    return
+
+
+@keyed
+def heapsort(elements: MutableSequence, left: int=0,
+             right: int=None, check: bool=False) -> HeapSortOutput:
+    """Sorts the sub-list in place using a heap built inside of it
+
+    The heap is built bottom-up, then the root is swapped with the last
+    element of the heap and sifted back down, once per element, so it's
+    O(n log n) with no extra space.
+
+    Args:
+     elements: collection of orderable items
+     left: index of the first element of the sub-list to sort
+     right: index of the last element of the sub-list to sort (default is the end)
+     check: check the heap property after every step (O(n) each, for debugging)
+
+    Returns:
+     count of elements, comparisons made, swaps made, sorted elements
+
+    Raises:
+     AssertionError: check is on and the heap property failed
+    """
+    if right is None:
+        right = len(elements) - 1
+
+    comparisons = swaps = 0
+    size = right - left + 1
+
+    for node in range(left + size//2 - 1, left - 1, -1):
+        node_comparisons, node_swaps = sift_down(elements, left, node, right)
+        comparisons += node_comparisons
+        swaps += node_swaps
+
+    if check:
+        check_heap(elements, left, right)
+
+    for last in range(right, left, -1):
+        elements[left], elements[last] = elements[last], elements[left]
+        swaps += 1
+        node_comparisons, node_swaps = sift_down(elements, left, left,
+                                                 last - 1)
+        comparisons += node_comparisons
+        swaps += node_swaps
+        if check:
+            check_heap(elements, left, last - 1)
+    return HeapSortOutput(max(size, 0), comparisons, swaps, elements)
+
 
 @define
 class HeapSort:
-    """Sort using a heap
+    """Sort using a heap built in place in the items
 
     Args:
-     items: collection of items for the sort
+     items: collection of items to sort (sorted in place, not copied)
+     check: check the heap property after every step (slow, for debugging)
     """
     items: list
-    _heap: MaxHeap=None
-
-    @property
-    def heap(self) -> MaxHeap:
-        """The heap of items"""
-        if self._heap is None:
-            self._heap = MaxHeap.from_list(self.items)
-            self._heap()
-        return self._heap
+    check: bool = False
 
     @property
     def without_root(self) -> list:
-        """The items without the root """
-        return self.heap.heap[self.heap.ROOT_NODE:]
-
-    def __call__(self):
-        """sorts the items"""
-        self.heap()
-        for node in range(self.heap.size, 1, -1):
-            self.heap.heap[self.heap.ROOT_NODE], self.heap.heap[node] = (
-                self.heap.heap[node],
-                self.heap.maximum)
-            self.heap.size -= 1
-            self.heap()
-        return
+        """The sorted items
+
+        The heap used to be a padded copy of the items whose padding
+        had to be stripped off, now the items themselves get sorted.
+        """
+        return self.items
+
+    def __call__(self) -> HeapSortOutput:
+        """sorts the items
+
+        Returns:
+         count of elements, comparisons made, swaps made, sorted elements
+        """
+        return heapsort(self.items, check=self.check)
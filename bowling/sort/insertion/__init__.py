@@ -1 +1,2 @@
 from .insertion_stuff import insertion_sort
+from .insertion_stuff import binary_insertion_sort, InsertionOutput
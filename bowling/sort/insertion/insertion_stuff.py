@@ -2,29 +2,45 @@
 from collections import namedtuple
 from collections.abc import MutableSequence
 
+# this project
+from bowling.sort import kernels
+from bowling.sort.keys import keyed
+
 InsertionOutput = namedtuple("InsertionOutput", ["element_count",
                                                  "comparisons",
                                                  "swaps",
                                                  "elements"])
 
 
-def insertion_sort(elements: MutableSequence) -> InsertionOutput:
+@keyed
+def insertion_sort(elements: MutableSequence, left: int=0,
+                   right: int=None) -> InsertionOutput:
     """Sorts elements using iterative insertion-sort
 
     Args:
      elements: sortable collection of elements
+     left: index of the first element of the sub-list to sort
+     right: index of the last element of the sub-list to sort (default is the end)
 
     Returns:
      count of elements, comparisons made, swaps made, sorted elements
     """
+    if right is None:
+        right = len(elements) - 1
+
+    if kernels.use_kernel(elements):
+        comparisons, swaps = kernels.insertion(elements, left, right)
+        return InsertionOutput(max(right - left + 1, 0), comparisons, swaps,
+                               elements)
+
     comparisons = swaps = 0
-    for next_unsorted_cell in range(1, len(elements)):
+    for next_unsorted_cell in range(left + 1, right + 1):
         thing_to_insert = elements[next_unsorted_cell]
 
         in_front_of_me, to_the_right = (next_unsorted_cell - 1,
                                         next_unsorted_cell)
 
-        while not (in_front_of_me < 0 or
+        while not (in_front_of_me < left or
                    elements[in_front_of_me] <= thing_to_insert):
             comparisons += 1
             swaps += 1
@@ -35,4 +51,55 @@ def insertion_sort(elements: MutableSequence) -> InsertionOutput:
         elements[to_the_right] = thing_to_insert
         swaps += 1
 
-    return InsertionOutput(len(elements), comparisons, swaps, elements)
+    return InsertionOutput(max(right - left + 1, 0), comparisons, swaps,
+                           elements)
+
+
+@keyed
+def binary_insertion_sort(elements: MutableSequence, left: int=0,
+                          right: int=None) -> InsertionOutput:
+    """Sorts elements using insertion-sort with a binary search
+
+    Each element is first compared to the one in front of it (so
+    already-sorted stretches cost one comparison per element), otherwise
+    its place in the sorted part is found by bisection and the elements
+    in the way are moved over with a single slice assignment. Equal
+    elements are put after the ones already sorted so the sort is stable.
+    Like ~insertion_sort~ the swaps are the elements moved (the ones
+    shifted over plus the one inserted), but an element that's already
+    in place isn't written back so it isn't counted.
+
+    Args:
+     elements: sortable collection of elements
+     left: index of the first element of the sub-list to sort
+     right: index of the last element of the sub-list to sort (default is the end)
+
+    Returns:
+     count of elements, comparisons made, swaps made, sorted elements
+    """
+    if right is None:
+        right = len(elements) - 1
+
+    comparisons = swaps = 0
+    for next_unsorted_cell in range(left + 1, right + 1):
+        thing_to_insert = elements[next_unsorted_cell]
+
+        comparisons += 1
+        if not thing_to_insert < elements[next_unsorted_cell - 1]:
+            continue
+
+        low, high = left, next_unsorted_cell - 1
+        while low < high:
+            middle = (low + high)//2
+            comparisons += 1
+            if thing_to_insert < elements[middle]:
+                high = middle
+            else:
+                low = middle + 1
+
+        elements[low + 1:next_unsorted_cell + 1] = elements[low:next_unsorted_cell]
+        elements[low] = thing_to_insert
+        swaps += next_unsorted_cell - low + 1
+
+    return InsertionOutput(max(right - left + 1, 0), comparisons, swaps,
+                           elements)
@@ -0,0 +1,245 @@
+# python
+from collections.abc import Callable, Iterable, MutableSequence
+from functools import wraps
+from time import perf_counter
+
+# pypi
+# https://www.attrs.org/en/stable/index.html
+from attrs import asdict, define
+
+# this project
+from bowling.sort.insertion import InsertionOutput
+
+
+@define
+class SortStats:
+    """The counts for one run of a sort
+
+    Args:
+     algorithm: name of the sort
+     element_count: number of elements sorted
+     comparisons: comparisons between elements
+     reads: elements read out of the collection
+     writes: elements written into the collection (including shifts)
+     swaps: exchanges of the elements at two different indices (an
+            element swapped with itself isn't counted)
+     operations: the sort's own runtime count (for sorts that only report that)
+     seconds: wall-clock time for the sort
+    """
+    algorithm: str
+    element_count: int
+    comparisons: int = 0
+    reads: int = 0
+    writes: int = 0
+    swaps: int = 0
+    operations: int = 0
+    seconds: float = 0.0
+
+    @classmethod
+    def from_output(cls, algorithm: str, output, seconds: float=0.0,
+                    element_count: int=0) -> "SortStats":
+        """Converts what one of the sorts returned into stats
+
+        This handles the namedtuples (BubbleOutput, InsertionOutput,
+        SelectionOutput, QuicksortOutput, HeapSortOutput, ShellOutput)
+        and the plain runtime counts the mergesorts return. The insertion
+        sorts' "swaps" are the elements they shifted, so they go to
+        writes along with the ShellOutput shifts. The stats only have
+        what the sort counted, so the reads (and the writes of the sorts
+        that swap) are left at zero.
+
+        Args:
+         algorithm: name of the sort
+         output: what the sort returned
+         seconds: how long the sort took
+         element_count: number of elements sorted (only used for the
+                        runtime counts, which don't include it)
+
+        Returns:
+         the stats for the run
+        """
+        if isinstance(output, int):
+            return cls(algorithm=algorithm, element_count=element_count,
+                       operations=output, seconds=seconds)
+        fields = output._asdict()
+        if isinstance(output, InsertionOutput):
+            fields["shifts"], fields["swaps"] = fields["swaps"], 0
+        return cls(algorithm=algorithm,
+                   element_count=fields["element_count"],
+                   comparisons=fields.get("comparisons", 0),
+                   swaps=fields.get("swaps", 0),
+                   writes=fields.get("shifts", 0),
+                   seconds=seconds)
+
+    def as_dict(self) -> dict:
+        """The stats as a dict (for logging or JSON)"""
+        return asdict(self)
+
+
+@define
+class Counter:
+    """Running tallies shared by the counting wrappers"""
+    comparisons: int = 0
+    reads: int = 0
+    writes: int = 0
+    swaps: int = 0
+
+
+class Counted:
+    """Wraps an element so every comparison it's part of gets counted
+
+    Args:
+     value: the element
+     counter: where to tally the comparisons
+    """
+    __slots__ = ("value", "counter")
+
+    def __init__(self, value, counter: Counter) -> None:
+        self.value = value
+        self.counter = counter
+        return
+
+    def __lt__(self, other) -> bool:
+        self.counter.comparisons += 1
+        return self.value < getattr(other, "value", other)
+
+    def __le__(self, other) -> bool:
+        self.counter.comparisons += 1
+        return self.value <= getattr(other, "value", other)
+
+    def __gt__(self, other) -> bool:
+        self.counter.comparisons += 1
+        return self.value > getattr(other, "value", other)
+
+    def __ge__(self, other) -> bool:
+        self.counter.comparisons += 1
+        return self.value >= getattr(other, "value", other)
+
+    def __eq__(self, other) -> bool:
+        self.counter.comparisons += 1
+        return self.value == getattr(other, "value", other)
+
+    def __ne__(self, other) -> bool:
+        self.counter.comparisons += 1
+        return self.value != getattr(other, "value", other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"Counted({self.value!r})"
+
+
+class CountingSequence(MutableSequence):
+    """A list proxy that counts reads, writes and swaps
+
+    A swap is two writes in a row that put the elements last read from
+    two indices into each other's place (which is what
+    ~a[i], a[j] = a[j], a[i]~ does). Slices come back as new counting
+    sequences that share the counter, so sorts that split the collection
+    (like the recursive mergesort) are counted all the way down.
+
+    Args:
+     elements: the list to wrap (used directly, not copied)
+     counter: where to tally the counts
+    """
+    __slots__ = ("elements", "counter", "_last_reads", "_pending")
+
+    def __init__(self, elements: list, counter: Counter) -> None:
+        self.elements = elements
+        self.counter = counter
+        self._last_reads = [(None, None), (None, None)]
+        self._pending = None
+        return
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            chunk = self.elements[index]
+            self.counter.reads += len(chunk)
+            return CountingSequence(chunk, self.counter)
+        value = self.elements[index]
+        self.counter.reads += 1
+        self._last_reads = [self._last_reads[1], (index, value)]
+        return value
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            values = list(getattr(value, "elements", value))
+            self.counter.writes += len(values)
+            self.elements[index] = values
+            self._pending = None
+            return
+
+        self.elements[index] = value
+        self.counter.writes += 1
+        source = None
+        for read_index, read_value in self._last_reads:
+            if read_value is value and read_index is not None:
+                source = read_index % len(self.elements)
+        index %= len(self.elements)
+        if source is None or source == index:
+            self._pending = None
+        elif self._pending == (source, index):
+            self.counter.swaps += 1
+            self._pending = None
+        else:
+            self._pending = (index, source)
+        return
+
+    def __delitem__(self, index) -> None:
+        del self.elements[index]
+        return
+
+    def insert(self, index: int, value) -> None:
+        self.counter.writes += 1
+        self.elements.insert(index, value)
+        return
+
+    def __add__(self, other: Iterable) -> "CountingSequence":
+        return CountingSequence(self.elements + list(getattr(other, "elements", other)),
+                                self.counter)
+
+    def __copy__(self) -> "CountingSequence":
+        return CountingSequence(list(self.elements), self.counter)
+
+
+def instrumented(sort: Callable, name: str=None) -> Callable[..., SortStats]:
+    """Wraps a sort so running it returns its counts
+
+    The wrapped sort gets a ~CountingSequence~ of ~Counted~ elements,
+    and when it's done the sorted values are copied back into the
+    original collection. The sort itself isn't changed, so calling it
+    directly doesn't pay for the proxy, but the sorts still keep their
+    own comparison and swap tallies so it isn't free of counting (the
+    partitions without "counter" in their names are the only ones that
+    don't count anything).
+
+    Args:
+     sort: any of the in-place sorts that take a mutable sequence first
+     name: what to call the sort in the stats (default is its __name__)
+
+    Returns:
+     function that takes the same arguments as the sort and returns SortStats
+    """
+    algorithm = name or getattr(sort, "__name__", repr(sort))
+
+    @wraps(sort)
+    def counted_sort(elements: MutableSequence, *args, **kwargs) -> SortStats:
+        counter = Counter()
+        proxy = CountingSequence([Counted(element, counter)
+                                  for element in elements], counter)
+        started = perf_counter()
+        output = sort(proxy, *args, **kwargs)
+        seconds = perf_counter() - started
+        elements[:] = [counted.value for counted in proxy.elements]
+        return SortStats(algorithm=algorithm,
+                         element_count=len(elements),
+                         comparisons=counter.comparisons,
+                         reads=counter.reads,
+                         writes=counter.writes,
+                         swaps=counter.swaps,
+                         operations=output if isinstance(output, int) else 0,
+                         seconds=seconds)
+    return counted_sort
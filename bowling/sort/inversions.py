@@ -0,0 +1,278 @@
+# python
+from collections.abc import Sequence
+
+import sys
+
+# this project
+from bowling.sort.bubble import BubbleOutput
+from bowling.sort.insertion import InsertionOutput
+from bowling.sort.merge import merge
+
+
+def is_array(collection: Sequence) -> bool:
+    """Checks if the collection is a NumPy array
+
+    This doesn't import numpy, if it hasn't been imported nothing can
+    be an array.
+
+    Args:
+     collection: what to check
+
+    Returns:
+     True if it's a numpy.ndarray
+    """
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(collection, numpy.ndarray)
+
+
+def count_inversions(collection: Sequence) -> int:
+    """Counts the pairs of elements that are out of order
+
+    This is a bottom-up mergesort of a copy of the collection. Before
+    each pair of runs is merged, one sweep counts for every element of
+    the right run how many elements of the left run are bigger than it,
+    so it takes O(n log n) time instead of the O(n^2) a bubble sort
+    would need to count its swaps. NumPy arrays get ~array_inversions~
+    instead.
+
+    Args:
+     collection: sequence of orderable elements (not changed)
+
+    Returns:
+     number of (i, j) pairs with i < j and collection[i] > collection[j]
+    """
+    if is_array(collection):
+        return array_inversions(collection)
+    items = len(collection)
+    source, target = list(collection), [None] * items
+    inversions = 0
+    width = 1
+    while width < items:
+        for left_start in range(0, items, 2 * width):
+            middle = min(left_start + width, items)
+            right_stop = min(left_start + 2 * width, items)
+            next_left = left_start
+            for next_right in range(middle, right_stop):
+                element = source[next_right]
+                while next_left < middle and source[next_left] <= element:
+                    next_left += 1
+                inversions += middle - next_left
+            merge(source, source, target,
+                  left_start=left_start, left_stop=middle,
+                  right_start=middle, right_stop=right_stop,
+                  put_at=left_start)
+        source, target = target, source
+        width *= 2
+    return inversions
+
+
+def left_greater_counts(collection: Sequence) -> list[int]:
+    """Counts, for each element, the bigger elements in front of it
+
+    This is the same merge-based count as ~count_inversions~ but the
+    elements carry their original index so each count can be credited
+    to the element it belongs to. Equal elements are ordered by their
+    index so they don't count as inversions.
+
+    Args:
+     collection: sequence of orderable elements (not changed)
+
+    Returns:
+     list with the count for the element at each index
+    """
+    items = len(collection)
+    source = [(element, index) for index, element in enumerate(collection)]
+    target = [None] * items
+    counts = [0] * items
+    width = 1
+    while width < items:
+        for left_start in range(0, items, 2 * width):
+            middle = min(left_start + width, items)
+            right_stop = min(left_start + 2 * width, items)
+            next_left = left_start
+            for next_right in range(middle, right_stop):
+                record = source[next_right]
+                while next_left < middle and source[next_left] < record:
+                    next_left += 1
+                counts[record[1]] += middle - next_left
+            merge(source, source, target,
+                  left_start=left_start, left_stop=middle,
+                  right_start=middle, right_stop=right_stop,
+                  put_at=left_start)
+        source, target = target, source
+        width *= 2
+    return counts
+
+
+def stable_ranks(values: Sequence) -> Sequence:
+    """Where each value ends up in a stable sort
+
+    Args:
+     values: 1-D NumPy array of orderable values
+
+    Returns:
+     array of the final index for each value (equal values keep their order)
+    """
+    import numpy
+    order = numpy.argsort(values, kind="stable")
+    ranks = numpy.empty(len(values), dtype=numpy.int64)
+    ranks[order] = numpy.arange(len(values))
+    return ranks
+
+
+def array_inversions(values: Sequence) -> int:
+    """Counts the out-of-order pairs in an array with vectorized merge levels
+
+    This does the same counting as ~count_inversions~ but one level of
+    the bottom-up merge at a time instead of one merge at a time. The
+    values are replaced by their stable ranks (so ties aren't
+    inversions) and each element gets the key (pair of blocks, rank),
+    which keeps the left blocks of every pair sorted together in one
+    array so a single ~searchsorted~ counts, for every right-block
+    element, the left-block elements below it.
+
+    Args:
+     values: 1-D NumPy array of orderable values
+
+    Returns:
+     number of (i, j) pairs with i < j and values[i] > values[j]
+    """
+    import numpy
+    items = len(values)
+    ranks = stable_ranks(values)
+    positions = numpy.arange(items)
+    inversions = 0
+    width = 1
+    while width < items:
+        pairs = positions//(2 * width)
+        keys = pairs * items + ranks
+        in_left = (positions//width) % 2 == 0
+        left_keys = numpy.sort(keys[in_left])
+        right_keys, right_pairs = keys[~in_left], pairs[~in_left]
+        left_sizes = numpy.minimum(width, items - right_pairs * 2 * width)
+        smaller = (numpy.searchsorted(left_keys, right_keys)
+                   - numpy.searchsorted(left_keys, right_pairs * items))
+        inversions += int((left_sizes - smaller).sum())
+        width *= 2
+    return inversions
+
+
+def bubble_passes(elements: Sequence) -> int:
+    """Counts the passes of bubble sort that make at least one swap
+
+    Every pass moves each element that has bigger elements in front of
+    it one place left, so this is the largest of the
+    ~left_greater_counts~. For a NumPy array it's worked out from the
+    stable ranks instead, as the furthest any value has to move left to
+    get to its place.
+
+    Args:
+     elements: sequence of orderable elements (not changed)
+
+    Returns:
+     number of passes with swaps
+    """
+    items = len(elements)
+    if items < 2:
+        return 0
+    if is_array(elements):
+        import numpy
+        return max(int((numpy.arange(items) - stable_ranks(elements)).max()), 0)
+    return max(left_greater_counts(elements))
+
+
+def bubble_comparisons(items: int) -> int:
+    """Comparisons ~bubble~ makes (every adjacent pair on every pass)
+
+    Args:
+     items: number of elements
+
+    Returns:
+     n(n-1)/2
+    """
+    return items * (items - 1)//2
+
+
+def bubba_comparisons(items: int, passes: int) -> int:
+    """Comparisons ~bubba~ makes given how many of its passes swap
+
+    bubba makes one more pass to see that nothing swaps (unless it has
+    already run out of passes), and pass k makes n - 1 - k comparisons.
+
+    Args:
+     items: number of elements
+     passes: passes that make swaps (see ~bubble_passes~)
+
+    Returns:
+     count of comparisons
+    """
+    if items < 2:
+        return 0
+    passes = min(passes + 1, items - 1)
+    return passes * (items - 1) - passes * (passes - 1)//2
+
+
+def bubble_stats(elements: Sequence) -> BubbleOutput:
+    """Predicts what ~bubble~ would count without sorting
+
+    Bubble sort compares every adjacent pair on every pass, which is
+    n(n-1)/2 comparisons, and each swap fixes exactly one inversion.
+
+    Args:
+     elements: sequence of orderable elements (not changed)
+
+    Returns:
+     number of elements, comparisons, swaps, the (unsorted) elements
+    """
+    return BubbleOutput(len(elements), bubble_comparisons(len(elements)),
+                        count_inversions(elements), elements)
+
+
+def bubba_stats(elements: Sequence) -> BubbleOutput:
+    """Predicts what ~bubba~ (bubble sort with early exit) would count
+
+    The passes that swap come from ~bubble_passes~ and the comparisons
+    from ~bubba_comparisons~. For a list the swaps are the sum of the
+    same ~left_greater_counts~ the passes come from, for a NumPy array
+    they're the ~array_inversions~.
+
+    Args:
+     elements: sequence of orderable elements (not changed)
+
+    Returns:
+     number of elements, comparisons, swaps, the (unsorted) elements
+    """
+    items = len(elements)
+    if items < 2:
+        return BubbleOutput(items, 0, 0, elements)
+    if is_array(elements):
+        passes, swaps = bubble_passes(elements), array_inversions(elements)
+    else:
+        counts = left_greater_counts(elements)
+        passes, swaps = max(counts), sum(counts)
+    return BubbleOutput(items, bubba_comparisons(items, passes), swaps,
+                        elements)
+
+
+def insertion_stats(elements: Sequence, left: int=0,
+                    right: int=None) -> InsertionOutput:
+    """Predicts what ~insertion_sort~ would count without sorting
+
+    insertion_sort counts one comparison and one swap for every element
+    it shifts (which is once per inversion) plus one swap to drop each
+    element after the first into place.
+
+    Args:
+     elements: sequence of orderable elements (not changed)
+     left: index of the first element of the sub-list
+     right: index of the last element of the sub-list (default is the end)
+
+    Returns:
+     count of elements, comparisons, swaps, the (unsorted) elements
+    """
+    if right is None:
+        right = len(elements) - 1
+    items = max(right - left + 1, 0)
+    inversions = count_inversions(elements[left:right + 1]) if items else 0
+    return InsertionOutput(items, inversions,
+                           inversions + max(items - 1, 0), elements)
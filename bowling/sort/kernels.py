@@ -0,0 +1,366 @@
+"""Numba-compiled versions of the simple sorts for NumPy arrays
+
+The sorts in the other modules check ~use_kernel~ and hand typed arrays
+to these, everything else (and everything if numba isn't installed)
+goes through the pure-python code. The kernels do the same steps as
+the python versions so the counts they return are identical, they
+just return the counts as plain tuples so the callers can build their
+own namedtuples.
+
+Importing numba takes most of a second so it isn't imported until a
+NumPy array is actually passed to one of the sorts, which is also when
+the kernels get wrapped with ~njit~ (and numba compiles each one the
+first time it's called).
+"""
+# python
+from collections.abc import Sequence
+
+import sys
+
+MINIMUM_GALLOP = 7
+
+# booleans, signed and unsigned integers and floats
+PRIMITIVE_KINDS = "biuf"
+
+# None until the first NumPy array shows up and numba is looked for
+NUMBA_AVAILABLE = None
+
+KERNELS = []
+
+
+def use_kernel(*collections: Sequence) -> bool:
+    """Checks if the compiled kernels can take the collections
+
+    If numpy hasn't been imported nothing can be a NumPy array, so this
+    doesn't import numpy (or numba) itself.
+
+    Args:
+     collections: what's being passed to the sort
+
+    Returns:
+     True if numba is installed and all of them are 1-D primitive NumPy arrays
+    """
+    numpy = sys.modules.get("numpy")
+    if numpy is None or not all(
+            isinstance(collection, numpy.ndarray)
+            and collection.ndim == 1
+            and collection.dtype.kind in PRIMITIVE_KINDS
+            for collection in collections):
+        return False
+    return load_kernels()
+
+
+def load_kernels() -> bool:
+    """Imports numba and compiles the kernels the first time it's called
+
+    The kernels are replaced in this module's namespace all at once so
+    the ones that call each other (merge calls gallop) get the compiled
+    versions.
+
+    Returns:
+     True if numba is installed
+    """
+    global NUMBA_AVAILABLE
+    if NUMBA_AVAILABLE is None:
+        try:
+            from numba import njit
+        except ImportError:
+            NUMBA_AVAILABLE = False
+        else:
+            namespace = globals()
+            for name in KERNELS:
+                namespace[name] = njit(nogil=True, cache=True)(namespace[name])
+            NUMBA_AVAILABLE = True
+    return NUMBA_AVAILABLE
+
+
+def _compile(function):
+    """Registers the function to be njit-ed by ~load_kernels~"""
+    KERNELS.append(function.__name__)
+    return function
+
+
+@_compile
+def bubba(elements) -> tuple:
+    """Bubble sort that stops when a pass makes no swaps
+
+    Returns:
+     comparisons, swaps
+    """
+    all_but_one = len(elements) - 1
+    comparisons = swaps = 0
+    for items_sorted in range(all_but_one):
+        swapped_at_least_once = False
+        for in_front_of_us in range(all_but_one - items_sorted):
+            comparisons += 1
+            to_the_right = in_front_of_us + 1
+            if elements[to_the_right] < elements[in_front_of_us]:
+                (elements[in_front_of_us],
+                 elements[to_the_right]) = (elements[to_the_right],
+                                            elements[in_front_of_us])
+                swaps += 1
+                swapped_at_least_once = True
+        if not swapped_at_least_once:
+            break
+    return comparisons, swaps
+
+
+@_compile
+def bubble(elements) -> tuple:
+    """Bubble sort that always makes every pass
+
+    Returns:
+     comparisons, swaps
+    """
+    all_but_one = len(elements) - 1
+    comparisons = swaps = 0
+    for items_sorted in range(all_but_one):
+        for in_front_of_us in range(all_but_one - items_sorted):
+            comparisons += 1
+            to_the_right = in_front_of_us + 1
+            if elements[to_the_right] < elements[in_front_of_us]:
+                (elements[in_front_of_us],
+                 elements[to_the_right]) = (elements[to_the_right],
+                                            elements[in_front_of_us])
+                swaps += 1
+    return comparisons, swaps
+
+
+@_compile
+def selection(elements) -> tuple:
+    """Selection sort
+
+    Returns:
+     comparisons, swaps
+    """
+    number_of_elements = len(elements)
+    comparisons = swaps = 0
+    for start_of_unselected in range(number_of_elements - 1):
+        smallest_unselected = start_of_unselected
+        for next_unselected in range(start_of_unselected + 1,
+                                     number_of_elements):
+            comparisons += 1
+            if elements[next_unselected] < elements[smallest_unselected]:
+                smallest_unselected = next_unselected
+        swaps += smallest_unselected != start_of_unselected
+        elements[start_of_unselected], elements[smallest_unselected] = (
+            elements[smallest_unselected], elements[start_of_unselected])
+    return comparisons, swaps
+
+
+@_compile
+def insertion(elements, left: int, right: int) -> tuple:
+    """Insertion sort of elements[left:right + 1]
+
+    Returns:
+     comparisons, swaps
+    """
+    comparisons = swaps = 0
+    for next_unsorted_cell in range(left + 1, right + 1):
+        thing_to_insert = elements[next_unsorted_cell]
+        in_front_of_me = next_unsorted_cell - 1
+        while (in_front_of_me >= left
+               and not elements[in_front_of_me] <= thing_to_insert):
+            comparisons += 1
+            swaps += 1
+            elements[in_front_of_me + 1] = elements[in_front_of_me]
+            in_front_of_me -= 1
+        elements[in_front_of_me + 1] = thing_to_insert
+        swaps += 1
+    return comparisons, swaps
+
+
+@_compile
+def partition_clrs(collection, left: int, right: int) -> tuple:
+    """Partitions around the last element
+
+    Returns:
+     pivot index, comparisons, swaps
+    """
+    pivot_element = collection[right]
+    lower_bound = left - 1
+    swaps = 0
+    for upper_bound in range(left, right):
+        if collection[upper_bound] <= pivot_element:
+            lower_bound += 1
+            (collection[lower_bound],
+             collection[upper_bound]) = (collection[upper_bound],
+                                         collection[lower_bound])
+            swaps += lower_bound != upper_bound
+    pivot = lower_bound + 1
+    collection[pivot], collection[right] = collection[right], collection[pivot]
+    return pivot, right - left, swaps + (pivot != right)
+
+
+@_compile
+def partition_levitin(collection, left: int, right: int) -> tuple:
+    """Hoare-style partition around the first element
+
+    Returns:
+     pivot index, comparisons, swaps
+    """
+    pivot_element = collection[left]
+    partition_left = left
+    partition_right = right + 1
+    comparisons = swaps = 0
+
+    while True:
+        while partition_left < right:
+            partition_left += 1
+            comparisons += 1
+            if collection[partition_left] >= pivot_element:
+                break
+
+        while True:
+            partition_right -= 1
+            comparisons += 1
+            if collection[partition_right] <= pivot_element:
+                break
+
+        if partition_left >= partition_right:
+            break
+
+        collection[partition_left], collection[partition_right] = (
+            collection[partition_right], collection[partition_left])
+        swaps += 1
+
+    collection[left], collection[partition_right] = (
+        collection[partition_right], collection[left])
+    return partition_right, comparisons, swaps + (partition_right != left)
+
+
+@_compile
+def partition_three_way(collection, left: int, right: int) -> tuple:
+    """Dutch National Flag partition around the first element
+
+    Returns:
+     lower, upper, comparisons, swaps
+    """
+    pivot_element = collection[left]
+    lower, next_unknown, upper = left, left + 1, right
+    comparisons = swaps = 0
+
+    while next_unknown <= upper:
+        comparisons += 1
+        if collection[next_unknown] < pivot_element:
+            collection[lower], collection[next_unknown] = (
+                collection[next_unknown], collection[lower])
+            swaps += lower != next_unknown
+            lower += 1
+            next_unknown += 1
+            continue
+
+        comparisons += 1
+        if collection[next_unknown] > pivot_element:
+            collection[next_unknown], collection[upper] = (
+                collection[upper], collection[next_unknown])
+            swaps += next_unknown != upper
+            upper -= 1
+        else:
+            next_unknown += 1
+    return lower, upper, comparisons, swaps
+
+
+@_compile
+def gallop(key, stack, start: int, stop: int, after_equal: bool) -> tuple:
+    """Exponential then binary search for where the key goes
+
+    Returns:
+     index where the key goes, comparisons
+    """
+    comparisons = 0
+    low, step = start, 1
+    high = stop
+    while True:
+        probe = start + step - 1
+        if probe >= stop:
+            high = stop
+            break
+        comparisons += 1
+        if after_equal:
+            goes_before = key < stack[probe]
+        else:
+            goes_before = not stack[probe] < key
+        if goes_before:
+            high = probe
+            break
+        low = probe + 1
+        step *= 2
+
+    while low < high:
+        middle = (low + high)//2
+        comparisons += 1
+        if after_equal:
+            goes_before = key < stack[middle]
+        else:
+            goes_before = not stack[middle] < key
+        if goes_before:
+            high = middle
+        else:
+            low = middle + 1
+    return low, comparisons
+
+
+@_compile
+def merge(left_stack, right_stack, target,
+          left_start: int, left_stop: int,
+          right_start: int, right_stop: int,
+          put_at: int, galloping: bool) -> int:
+    """Merges two sorted sections into the target
+
+    The block copies are forward loops rather than slice assignments
+    so a target that overlaps the right stack (behind where it's being
+    read from) is safe.
+
+    Returns:
+     count of basic operations
+    """
+    next_left, next_right, put_item_here = left_start, right_start, put_at
+    count = left_wins = right_wins = 0
+
+    while next_left < left_stop and next_right < right_stop:
+        count += 1
+        if left_stack[next_left] <= right_stack[next_right]:
+            target[put_item_here] = left_stack[next_left]
+            next_left += 1
+            left_wins, right_wins = left_wins + 1, 0
+        else:
+            target[put_item_here] = right_stack[next_right]
+            next_right += 1
+            left_wins, right_wins = 0, right_wins + 1
+        put_item_here += 1
+
+        if not galloping:
+            continue
+
+        if left_wins >= MINIMUM_GALLOP and next_left < left_stop:
+            block_stop, comparisons = gallop(right_stack[next_right],
+                                             left_stack, next_left, left_stop,
+                                             True)
+            count += comparisons + block_stop - next_left
+            while next_left < block_stop:
+                target[put_item_here] = left_stack[next_left]
+                next_left += 1
+                put_item_here += 1
+            left_wins = 0
+        elif right_wins >= MINIMUM_GALLOP and next_right < right_stop:
+            block_stop, comparisons = gallop(left_stack[next_left],
+                                             right_stack, next_right,
+                                             right_stop, False)
+            count += comparisons + block_stop - next_right
+            while next_right < block_stop:
+                target[put_item_here] = right_stack[next_right]
+                next_right += 1
+                put_item_here += 1
+            right_wins = 0
+
+    count += (left_stop - next_left) + (right_stop - next_right)
+    while next_left < left_stop:
+        target[put_item_here] = left_stack[next_left]
+        next_left += 1
+        put_item_here += 1
+    while next_right < right_stop:
+        target[put_item_here] = right_stack[next_right]
+        next_right += 1
+        put_item_here += 1
+    return count
@@ -0,0 +1,60 @@
+# python
+from collections.abc import Callable, MutableSequence
+from functools import wraps
+from inspect import signature
+
+
+def keyed(sort: Callable) -> Callable:
+    """Adds ~key~ and ~reverse~ arguments to an in-place sort
+
+    With neither argument the sort is called directly. Otherwise the key
+    is computed once per element and the sort is run on (key, index)
+    records (or (key, -index) when reversing, followed by a reversal),
+    so the comparisons are done by the tuples on the cached keys and
+    equal keys keep their original order whether or not the sort is
+    stable. Then the elements are put back in the sorted order.
+
+    Sorts that take ~left~ and ~right~ only have that sub-list decorated,
+    and the sort gets just the decorated sub-list (with ~left~ and
+    ~right~ moved to its ends) so the rest of the collection isn't
+    copied. If the sort returns a namedtuple with an ~elements~
+    field it gets the original collection back in place of the records.
+
+    Args:
+     sort: function that sorts the mutable sequence passed in first
+
+    Returns:
+     the sort with ~key~ and ~reverse~ keyword arguments added
+    """
+    parameters = signature(sort)
+
+    @wraps(sort)
+    def keyed_sort(elements: MutableSequence, *args, key: Callable=None,
+                   reverse: bool=False, **kwargs):
+        if key is None and not reverse:
+            return sort(elements, *args, **kwargs)
+
+        arguments = parameters.bind(elements, *args, **kwargs)
+        left = arguments.arguments.get("left", 0)
+        right = arguments.arguments.get("right")
+        stop = len(elements) if right is None else right + 1
+
+        originals = list(elements[left:stop])
+        keys = originals if key is None else [key(element)
+                                              for element in originals]
+        sign = -1 if reverse else 1
+        records = [(cached, sign * index) for index, cached in enumerate(keys)]
+        for name, bound in (("left", 0), ("right", len(records) - 1)):
+            if name in parameters.parameters:
+                arguments.arguments[name] = bound
+        arguments.arguments[next(iter(parameters.parameters))] = records
+        output = sort(*arguments.args, **arguments.kwargs)
+        if reverse:
+            records.reverse()
+
+        elements[left:stop] = [originals[sign * index]
+                               for _, index in records]
+        if hasattr(output, "_replace") and "elements" in output._fields:
+            output = output._replace(elements=elements)
+        return output
+    return keyed_sort
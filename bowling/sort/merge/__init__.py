@@ -1,2 +1,6 @@
-from .mergesort import mergesort
-from .merge import merge, merge_clrs
+from .mergesort import bottom_up_mergesort, mergesort
+from .merge import gallop, merge, merge_clrs
+from .natural import natural_mergesort
+from .parallel import parallel_mergesort
+from .external import external_sort
+from .kway import KWayMerge, kway_merge
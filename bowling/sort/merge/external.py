@@ -0,0 +1,152 @@
+# python
+from collections import namedtuple
+from collections.abc import Callable, Iterable, Iterator, MutableSequence
+from heapq import merge as heap_merge
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import io
+import sys
+
+# this package
+from .natural import natural_mergesort
+
+Sorter = Callable[[MutableSequence], object]
+
+ExternalSortOutput = namedtuple("ExternalSortOutput", ["element_count",
+                                                       "runs",
+                                                       "merge_passes"])
+
+MEGABYTE = 2**20
+DEFAULT_BUDGET = 64 * MEGABYTE
+MINIMUM_BUFFER = io.DEFAULT_BUFFER_SIZE
+POINTER_SIZE = 8
+
+
+def external_sort(source: Path, target: Path,
+                  memory_budget: int=DEFAULT_BUDGET,
+                  sort: Sorter=natural_mergesort,
+                  temporary_directory: Path=None, key: Callable=None,
+                  reverse: bool=False) -> ExternalSortOutput:
+    """Sorts the lines of a file that might not fit in memory
+
+    The lines are read in runs that fit in the memory budget, each run
+    is sorted with one of the in-memory sorts and spilled to a temporary
+    file, then the run files are merged into the target file. If there
+    are more runs than the budget can hold read-buffers for, the runs
+    are merged in groups over more than one pass.
+
+    Lines are compared as bytes and a newline is added to the last line
+    if it doesn't have one.
+
+    Args:
+     source: path to the file to sort
+     target: path to write the sorted lines to
+     memory_budget: approximate number of bytes of records to hold at once
+     sort: function that sorts a list in place
+     temporary_directory: where to put the run files (default is the system's)
+     key: function to get the value to compare for each line (passed to the sort)
+     reverse: sort from largest to smallest (equal keys keep their order)
+
+    Returns:
+     number of lines, number of runs, number of merge passes
+    """
+    with TemporaryDirectory(dir=temporary_directory) as run_directory:
+        run_directory = Path(run_directory)
+        element_count = 0
+        runs = []
+        with open(source, "rb") as lines:
+            for run in read_runs(lines, memory_budget):
+                element_count += len(run)
+                if key is None and not reverse:
+                    sort(run)
+                else:
+                    sort(run, key=key, reverse=reverse)
+                runs.append(write_run(run, run_directory / f"run-{len(runs)}"))
+
+        run_count = len(runs)
+        fan_in = max(2, memory_budget//MINIMUM_BUFFER - 1)
+        merge_passes = 0
+        while len(runs) > fan_in:
+            merge_passes += 1
+            runs = [merge_runs(runs[start:start + fan_in],
+                               run_directory / f"pass-{merge_passes}-{start}",
+                               memory_budget, key, reverse)
+                    for start in range(0, len(runs), fan_in)]
+        merge_runs(runs, Path(target), memory_budget, key, reverse)
+        merge_passes += 1
+    return ExternalSortOutput(element_count=element_count, runs=run_count,
+                              merge_passes=merge_passes)
+
+
+def read_runs(lines: Iterable[bytes],
+              memory_budget: int) -> Iterator[list[bytes]]:
+    """Groups the lines into lists that fit in the memory budget
+
+    Args:
+     lines: source of the records
+     memory_budget: approximate number of bytes each run can use
+
+    Yields:
+     the next run of lines (unsorted)
+    """
+    run, used = [], 0
+    for line in lines:
+        if not line.endswith(b"\n"):
+            line += b"\n"
+        run.append(line)
+        used += sys.getsizeof(line) + POINTER_SIZE
+        if used >= memory_budget:
+            yield run
+            run, used = [], 0
+    if run:
+        yield run
+    return
+
+
+def write_run(run: list[bytes], path: Path) -> Path:
+    """Writes the sorted run to a file
+
+    Args:
+     run: sorted lines
+     path: where to write the lines
+
+    Returns:
+     the path to the run
+    """
+    with open(path, "wb") as writer:
+        writer.writelines(run)
+    return path
+
+
+def merge_runs(runs: list[Path], target: Path, memory_budget: int,
+               key: Callable=None, reverse: bool=False) -> Path:
+    """Merges the sorted run files into the target
+
+    The memory budget is split evenly into read-buffers for the runs and
+    a write-buffer for the target, and each run file is deleted once it's
+    merged (unless it's the target).
+
+    Args:
+     runs: paths to the sorted run files
+     target: path to write the merged lines to
+     memory_budget: bytes to split between the file buffers
+     key: function to get the value to compare for each line
+     reverse: whether the runs are sorted from largest to smallest
+
+    Returns:
+     the target path
+    """
+    buffer_size = max(MINIMUM_BUFFER, memory_budget//(len(runs) + 1))
+    readers = [open(run, "rb", buffering=buffer_size) for run in runs]
+    try:
+        with open(target, "wb", buffering=buffer_size) as writer:
+            writer.writelines(heap_merge(*readers, key=key, reverse=reverse))
+    finally:
+        for reader in readers:
+            reader.close()
+
+    for run in runs:
+        if run != target:
+            run.unlink()
+    return target
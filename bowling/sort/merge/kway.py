@@ -0,0 +1,115 @@
+# python
+from collections.abc import Callable, Iterable, Iterator
+
+# pypi
+# https://www.attrs.org/en/stable/index.html
+from attrs import define, field
+
+
+@define
+class KWayMerge:
+    """Lazily merges any number of sorted iterables
+
+    The sources sit at the leaves of a tournament tree of losers so each
+    item that comes out takes about log2(k) comparisons to replace, and
+    only one item per source is held at a time. Equal items come out in
+    the order of their sources so the merge is stable.
+
+    Args:
+     iterables: the sorted sources (lists, generators, open files,...)
+     key: function to get the value to compare from each item
+     comparisons: running count of the comparisons made
+    """
+    iterables: list = field(converter=list)
+    key: Callable = None
+    comparisons: int = 0
+
+    def _beats(self, source: int, other: int, keys: list,
+               alive: list) -> bool:
+        """Checks if the source's head goes out before the other's
+
+        Args:
+         source, other: indices of the sources to compare
+         keys: the comparison keys of the current heads
+         alive: whether each source still has items
+
+        Returns:
+         True if the source's head should come first
+        """
+        if not alive[other]:
+            return True
+        if not alive[source]:
+            return False
+        self.comparisons += 1
+        if source < other:
+            return not keys[other] < keys[source]
+        return keys[source] < keys[other]
+
+    def __iter__(self) -> Iterator:
+        """Yields the merged items"""
+        iterators = [iter(iterable) for iterable in self.iterables]
+        sources = len(iterators)
+        if not sources:
+            return
+
+        heads, keys, alive = [None] * sources, [None] * sources, [True] * sources
+
+        def advance(source: int) -> None:
+            """Moves the source on to its next item"""
+            for item in iterators[source]:
+                heads[source] = item
+                keys[source] = item if self.key is None else self.key(item)
+                return
+            alive[source] = False
+            heads[source] = keys[source] = None
+            return
+
+        for source in range(sources):
+            advance(source)
+
+        losers = [0] * sources
+
+        def play(node: int) -> int:
+            """Fills in the losers below the node and returns its winner"""
+            if node >= sources:
+                return node - sources
+            first, second = play(2 * node), play(2 * node + 1)
+            if self._beats(first, second, keys, alive):
+                losers[node] = second
+                return first
+            losers[node] = first
+            return second
+
+        winner = play(1)
+        while alive[winner]:
+            yield heads[winner]
+            advance(winner)
+            comparisons = 0
+            node = (winner + sources)//2
+            while node:
+                loser = losers[node]
+                if alive[loser]:
+                    if not alive[winner]:
+                        losers[node], winner = winner, loser
+                    else:
+                        comparisons += 1
+                        # ties go to the lower-numbered source
+                        if ((not keys[winner] < keys[loser]) if loser < winner
+                                else keys[loser] < keys[winner]):
+                            losers[node], winner = winner, loser
+                node //= 2
+            self.comparisons += comparisons
+        return
+
+
+def kway_merge(*iterables: Iterable, key: Callable=None) -> KWayMerge:
+    """Builds a lazy merge of the sorted iterables
+
+    Args:
+     iterables: the sorted sources
+     key: function to get the value to compare from each item
+
+    Returns:
+     KWayMerge to iterate over (its ~comparisons~ keeps the count)
+    """
+    return KWayMerge(iterables, key=key)
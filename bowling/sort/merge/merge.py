@@ -1,44 +1,146 @@
 # python
 from collections.abc import MutableSequence, Sequence
 
+# this project
+from bowling.sort import kernels
+
 INFINITY = float("inf")
+MINIMUM_GALLOP = 7
+
+
+def gallop(key, stack: Sequence, start: int, stop: int,
+           after_equal: bool=True) -> tuple[int, int]:
+    """Finds where the key goes in a sorted section of the stack
+
+    This probes at offsets 1, 2, 4, 8,... from the start then does a
+    binary search in the last gap, so it only takes O(log k) comparisons
+    when the key belongs k places in.
+
+    Args:
+     key: the item to find a place for
+     stack: collection with a sorted section to search
+     start: index of the first item in the section
+     stop: index just past the last item in the section
+     after_equal: if True the place is after items equal to the key, otherwise before
+
+    Returns:
+     index where the key goes, count of comparisons
+    """
+    comparisons = 0
+    low, step = start, 1
+    while True:
+        probe = start + step - 1
+        if probe >= stop:
+            high = stop
+            break
+        comparisons += 1
+        if ((key < stack[probe]) if after_equal
+                else not (stack[probe] < key)):
+            high = probe
+            break
+        low = probe + 1
+        step *= 2
+
+    while low < high:
+        middle = (low + high)//2
+        comparisons += 1
+        if ((key < stack[middle]) if after_equal
+                else not (stack[middle] < key)):
+            high = middle
+        else:
+            low = middle + 1
+    return low, comparisons
 
 
 def merge(left_stack: Sequence,
           right_stack: Sequence,
-          target: MutableSequence) -> int:
+          target: MutableSequence,
+          left_start: int=0, left_stop: int=None,
+          right_start: int=0, right_stop: int=None,
+          put_at: int=0, galloping: bool=False) -> int:
     """Merges values from left and right stacks into target collection
 
+    The start and stop arguments let the stacks be sections of larger
+    collections (even the same collection) so the caller doesn't have
+    to slice out copies to merge them. The target can overlap the right
+    stack as long as it starts no further right than ~right_start~ - one
+    side ahead, which lets an in-place merge copy out only the left run.
+
+    In galloping mode once one stack has supplied ~MINIMUM_GALLOP~ items
+    in a row the rest of its items that go before the other stack's next
+    item are found with ~gallop~ and copied as a block, which pays off
+    when one run is much bigger than the other or the runs barely overlap.
+
     Args:
      left_stack: sorted collection of items to merge
      right_stack: sorted collection of items to merge
      target: collection into which to merge the items
+     left_start: index of the first item to merge from the left stack
+     left_stop: index just past the last item in the left stack (default is the end)
+     right_start: index of the first item to merge from the right stack
+     right_stop: index just past the last item in the right stack (default is the end)
+     put_at: index in the target to put the first merged item
+     galloping: whether to switch to galloping when one side keeps winning
 
     Returns:
      count of basic operations
     """
-    left_size, right_size = len(left_stack), len(right_stack)
-    next_left = next_right = put_item_here = count = 0
+    if left_stop is None:
+        left_stop = len(left_stack)
+    if right_stop is None:
+        right_stop = len(right_stack)
+    if kernels.use_kernel(left_stack, right_stack, target):
+        return kernels.merge(left_stack, right_stack, target,
+                             left_start, left_stop, right_start, right_stop,
+                             put_at, galloping)
+
+    next_left, next_right, put_item_here = left_start, right_start, put_at
+    count = left_wins = right_wins = 0
     
-    while next_left < left_size and next_right < right_size:
+    while next_left < left_stop and next_right < right_stop:
         count += 1
         if left_stack[next_left] <= right_stack[next_right]:
             target[put_item_here] = left_stack[next_left]
             next_left += 1
+            left_wins, right_wins = left_wins + 1, 0
         else:
             target[put_item_here] = right_stack[next_right]
             next_right += 1
+            left_wins, right_wins = 0, right_wins + 1
 
         put_item_here += 1
+
+        if not galloping:
+            continue
+
+        if left_wins >= MINIMUM_GALLOP and next_left < left_stop:
+            block_stop, comparisons = gallop(right_stack[next_right],
+                                             left_stack, next_left, left_stop,
+                                             after_equal=True)
+            block = block_stop - next_left
+            count += comparisons + block
+            target[put_item_here:put_item_here + block] = left_stack[next_left:block_stop]
+            next_left, put_item_here = block_stop, put_item_here + block
+            left_wins = 0
+        elif right_wins >= MINIMUM_GALLOP and next_right < right_stop:
+            block_stop, comparisons = gallop(left_stack[next_left],
+                                             right_stack, next_right, right_stop,
+                                             after_equal=False)
+            block = block_stop - next_right
+            count += comparisons + block
+            target[put_item_here:put_item_here + block] = right_stack[next_right:block_stop]
+            next_right, put_item_here = block_stop, put_item_here + block
+            right_wins = 0
         
-    if next_left == left_size and next_right < right_size:
-        for stack_offset in range(left_size + right_size - put_item_here):
-            count += 1
-            target[put_item_here + stack_offset] = right_stack[next_right + stack_offset]
-    elif next_left < left_size:
-        for stack_offset in range(left_size + right_size - put_item_here):
-            count += 1
-            target[put_item_here + stack_offset] = left_stack[next_left + stack_offset]
+    # whatever is left over is copied as one block
+    if next_left == left_stop and next_right < right_stop:
+        remaining = right_stop - next_right
+        count += remaining
+        target[put_item_here:put_item_here + remaining] = right_stack[next_right:right_stop]
+    elif next_left < left_stop:
+        remaining = left_stop - next_left
+        count += remaining
+        target[put_item_here:put_item_here + remaining] = left_stack[next_left:left_stop]
     return count
 
 def merge_clrs(collection: MutableSequence,
@@ -1,14 +1,31 @@
 # python
 from collections.abc import MutableSequence, Sequence
+from copy import copy
+
+# this project
+from bowling.sort.keys import keyed
 
 # this package
 from .merge import merge, merge_clrs
 
 
 
+@keyed
 def mergesort(collection: MutableSequence) -> int:
     """Sorts the collection using a recursive mergesort
 
+    Args:
+     collection: a mutable sequence
+
+    Returns:
+     runtime count
+    """
+    return _mergesort(collection)
+
+
+def _mergesort(collection: MutableSequence) -> int:
+    """Does the recursion for mergesort (without the key handling)
+
     Args:
      collection: a mutable sequence
 
@@ -21,8 +38,41 @@ def mergesort(collection: MutableSequence) -> int:
         middle = items//2
         left_stack = collection[:middle]
         right_stack = collection[middle:]
-        assert len(left_stack) + len(right_stack) == items
-        count += mergesort(left_stack)
-        count += mergesort(right_stack)
+        count += _mergesort(left_stack)
+        count += _mergesort(right_stack)
         count += merge(left_stack, right_stack, collection)
     return count
+
+
+@keyed
+def bottom_up_mergesort(collection: MutableSequence) -> int:
+    """Sorts the collection using an iterative (bottom-up) mergesort
+
+    Instead of slicing out new lists at every level this merges runs of
+    width 1, 2, 4,... back and forth between the collection and a single
+    buffer the same size as the collection.
+
+    Args:
+     collection: a mutable sequence
+
+    Returns:
+     runtime count
+    """
+    items = len(collection)
+    count = 0
+    source, target = collection, copy(collection)
+    width = 1
+    while width < items:
+        for left_start in range(0, items, 2 * width):
+            middle = min(left_start + width, items)
+            right_stop = min(left_start + 2 * width, items)
+            count += merge(source, source, target,
+                           left_start=left_start, left_stop=middle,
+                           right_start=middle, right_stop=right_stop,
+                           put_at=left_start)
+        source, target = target, source
+        width *= 2
+
+    if source is not collection:
+        collection[:] = source
+    return count
@@ -0,0 +1,188 @@
+# python
+from collections.abc import MutableSequence
+
+# this project
+from bowling.sort.insertion import binary_insertion_sort
+from bowling.sort.keys import keyed
+
+# this package
+from .merge import gallop, merge
+
+SMALL_ENOUGH = 64
+
+
+def minimum_run_length(items: int) -> int:
+    """Picks the shortest run to build so the runs merge evenly
+
+    This is the Timsort calculation - the result is between 32 and 64
+    (or all the items if there are fewer than 64) and chosen so the
+    number of runs is a power of two or just under one.
+
+    Args:
+     items: number of items that will be sorted
+
+    Returns:
+     the minimum length for each run
+    """
+    extra_bit = 0
+    while items >= SMALL_ENOUGH:
+        extra_bit |= items & 1
+        items >>= 1
+    return items + extra_bit
+
+
+def count_run(collection: MutableSequence, start: int,
+              stop: int) -> tuple[int, int]:
+    """Finds the run beginning at start, reversing it if it's descending
+
+    Only strictly descending runs are reversed so that reversing them
+    doesn't change the order of equal items.
+
+    Args:
+     collection: the items being sorted
+     start: index of the first item in the run
+     stop: index just past the last item that could be in the run
+
+    Returns:
+     index just past the end of the run, count of comparisons
+    """
+    run_stop = start + 1
+    if run_stop == stop:
+        return run_stop, 0
+
+    comparisons = 1
+    if collection[run_stop] < collection[start]:
+        run_stop += 1
+        while run_stop < stop:
+            comparisons += 1
+            if not collection[run_stop] < collection[run_stop - 1]:
+                break
+            run_stop += 1
+        collection[start:run_stop] = collection[start:run_stop][::-1]
+    else:
+        run_stop += 1
+        while run_stop < stop:
+            comparisons += 1
+            if collection[run_stop] < collection[run_stop - 1]:
+                break
+            run_stop += 1
+    return run_stop, comparisons
+
+
+def merge_runs(collection: MutableSequence, start: int, middle: int,
+               stop: int) -> int:
+    """Merges two adjacent sorted runs in place
+
+    Items at the front of the left run that are no bigger than the
+    first item of the right run and items at the end of the right run
+    that are bigger than the last item of the left run are already where
+    they belong, so they get skipped using galloping searches. Only
+    what's left of the left run gets copied out before merging.
+
+    Args:
+     collection: the items being sorted
+     start: index of the first item of the left run
+     middle: index of the first item of the right run
+     stop: index just past the last item of the right run
+
+    Returns:
+     count of basic operations
+    """
+    start, count = gallop(collection[middle], collection, start, middle,
+                          after_equal=True)
+    if start == middle:
+        return count
+
+    stop, comparisons = gallop(collection[middle - 1], collection, middle,
+                               stop, after_equal=False)
+    count += comparisons
+
+    left_run = list(collection[start:middle])
+    count += len(left_run)
+    return count + merge(left_run, collection, collection,
+                         right_start=middle, right_stop=stop,
+                         put_at=start, galloping=True)
+
+
+@keyed
+def natural_mergesort(collection: MutableSequence) -> int:
+    """Sorts the collection by merging the runs that are already in it
+
+    The collection is scanned for ascending or strictly descending runs
+    (descending runs get reversed) and short runs are extended to the
+    minimum run length with binary insertion sort. Each run is pushed on a
+    stack and the top runs are merged whenever their lengths break the
+    Timsort invariants (each run is longer than the two above it put
+    together and longer than the one above it), which keeps the merges
+    balanced. Input that's already sorted takes one pass.
+
+    Args:
+     collection: a mutable sequence
+
+    Returns:
+     runtime count
+    """
+    items = len(collection)
+    minimum_run = minimum_run_length(items)
+    runs = []
+    count = start = 0
+
+    while start < items:
+        stop, comparisons = count_run(collection, start, items)
+        count += comparisons
+        if stop - start < minimum_run:
+            forced_stop = min(start + minimum_run, items)
+            output = binary_insertion_sort(collection, start, forced_stop - 1)
+            count += output.comparisons + output.swaps
+            stop = forced_stop
+
+        runs.append((start, stop - start))
+        count += _collapse(collection, runs)
+        start = stop
+
+    while len(runs) > 1:
+        count += _merge_at(collection, runs, len(runs) - 2)
+    return count
+
+
+def _collapse(collection: MutableSequence, runs: list) -> int:
+    """Merges runs on top of the stack until the invariants hold again
+
+    Args:
+     collection: the items being sorted
+     runs: stack of (start, length) runs
+
+    Returns:
+     count of basic operations
+    """
+    count = 0
+    while len(runs) > 1:
+        top = len(runs) - 2
+        if ((top > 0 and
+             runs[top - 1][1] <= runs[top][1] + runs[top + 1][1]) or
+            (top > 1 and
+             runs[top - 2][1] <= runs[top - 1][1] + runs[top][1])):
+            if runs[top - 1][1] < runs[top + 1][1]:
+                top -= 1
+        elif runs[top][1] > runs[top + 1][1]:
+            break
+        count += _merge_at(collection, runs, top)
+    return count
+
+
+def _merge_at(collection: MutableSequence, runs: list, index: int) -> int:
+    """Merges the run at index with the one after it on the stack
+
+    Args:
+     collection: the items being sorted
+     runs: stack of (start, length) runs
+     index: position in the stack of the left run to merge
+
+    Returns:
+     count of basic operations
+    """
+    (left_start, left_length), (right_start, right_length) = runs[index:index + 2]
+    count = merge_runs(collection, left_start, right_start,
+                       right_start + right_length)
+    runs[index:index + 2] = [(left_start, left_length + right_length)]
+    return count
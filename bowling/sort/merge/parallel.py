@@ -0,0 +1,256 @@
+# python
+from array import array, typecodes
+from collections.abc import Callable, MutableSequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import os
+
+# this package
+from .merge import merge
+from .mergesort import bottom_up_mergesort
+
+PARALLEL_THRESHOLD = 2**17
+INT_MIN, INT_MAX = -2**63, 2**63 - 1
+
+Run = tuple[int, int]
+
+
+def parallel_mergesort(collection: MutableSequence, processes: int=None,
+                       threshold: int=PARALLEL_THRESHOLD,
+                       typecode: str=None, key: Callable=None,
+                       reverse: bool=False) -> int:
+    """Sorts a collection of numbers using a pool of processes
+
+    The numbers are copied into shared memory once, each process sorts
+    a chunk of it, then the chunks are merged pairwise, level by level,
+    with every merge split into pieces so all the processes stay busy
+    even near the top of the tree. Only names and indices get sent to
+    the processes, never the numbers themselves.
+
+    Collections smaller than the threshold (or with fewer than two
+    numbers, or a pool of one) just get the serial bottom-up mergesort since starting the pool would cost
+    more than it saves. Sorts with a key or reversed also run serially
+    since the decorated records can't be put in shared memory, and so
+    do lists that ~guess_typecode~ can't find one array type for.
+
+    Args:
+     collection: list, array.array or numpy array of numbers
+     processes: size of the process pool (default is the number of CPUs)
+     threshold: smallest collection worth sorting in parallel
+     typecode: array-module type code for the numbers (guessed if not given)
+     key: function to get the value to compare for each number
+     reverse: sort from largest to smallest (equal keys keep their order)
+
+    Returns:
+     runtime count
+    """
+    processes = processes or os.cpu_count() or 1
+    items = len(collection)
+    if (items < max(threshold, 2) or processes < 2 or key is not None
+            or reverse):
+        return bottom_up_mergesort(collection, key=key, reverse=reverse)
+
+    typecode = typecode or guess_typecode(collection)
+    if typecode is None:
+        return bottom_up_mergesort(collection)
+
+    size = items * array(typecode).itemsize
+    source_memory = SharedMemory(create=True, size=size)
+    target_memory = SharedMemory(create=True, size=size)
+    try:
+        view = source_memory.buf.cast(typecode)
+        try:
+            view[:items] = array(typecode, collection)
+        finally:
+            view.release()
+
+        with ProcessPoolExecutor(processes) as pool:
+            chunk = -(-items//processes)
+            runs = [(start, min(start + chunk, items))
+                    for start in range(0, items, chunk)]
+            count = sum(pool.map(
+                _sort_run,
+                [(source_memory.name, typecode, start, stop)
+                 for start, stop in runs]))
+
+            while len(runs) > 1:
+                level_count, runs = _merge_level(pool, processes, runs,
+                                                 source_memory,
+                                                 target_memory, typecode)
+                count += level_count
+                source_memory, target_memory = target_memory, source_memory
+
+        view = source_memory.buf.cast(typecode)
+        try:
+            if isinstance(collection, list):
+                collection[:] = view[:items].tolist()
+            else:
+                collection[:] = array(typecode, view[:items])
+        finally:
+            view.release()
+    finally:
+        for memory in (source_memory, target_memory):
+            memory.close()
+            memory.unlink()
+    return count
+
+
+def guess_typecode(collection: MutableSequence) -> str:
+    """Picks the array-module type code to store the collection with
+
+    A list only gets a type code if it's all floats ('d') or all ints
+    that fit in 64 bits ('q'). Mixing them would quietly turn the ints
+    into floats (losing precision past 2^53), so mixed lists, ints that
+    are too big and anything that isn't a number get None instead.
+
+    Args:
+     collection: list, array.array or numpy array of numbers
+
+    Returns:
+     the collection's own type code if it has one, otherwise 'd', 'q' or None
+    """
+    typecode = getattr(collection, "typecode", None)
+    if typecode is not None:
+        return typecode
+
+    dtype = getattr(collection, "dtype", None)
+    if dtype is not None:
+        return dtype.char if dtype.char in typecodes else None
+
+    if all(type(item) is float for item in collection):
+        return "d"
+    if all(type(item) is int and INT_MIN <= item <= INT_MAX
+           for item in collection):
+        return "q"
+    return None
+
+
+def co_rank(output_rank: int, view: memoryview, left_start: int,
+            left_stop: int, right_start: int, right_stop: int) -> int:
+    """Finds how many left-run items are in the first output_rank merged items
+
+    Ties go to the left run, the same as ~merge~, so pieces merged
+    independently line up into a stable merge.
+
+    Args:
+     output_rank: number of items at the front of the merged output
+     view: the memory holding both runs
+     left_start, left_stop: bounds of the left run
+     right_start, right_stop: bounds of the right run
+
+    Returns:
+     count of items taken from the left run
+    """
+    low = max(0, output_rank - (right_stop - right_start))
+    high = min(output_rank, left_stop - left_start)
+    while low < high:
+        from_left = (low + high)//2
+        from_right = output_rank - from_left
+        if (view[left_start + from_left]
+                <= view[right_start + from_right - 1]):
+            low = from_left + 1
+        else:
+            high = from_left
+    return low
+
+
+def _merge_level(pool: Executor, processes: int, runs: list[Run],
+                 source_memory: SharedMemory, target_memory: SharedMemory,
+                 typecode: str) -> tuple[int, list[Run]]:
+    """Merges the runs pairwise from the source memory into the target memory
+
+    Args:
+     pool: the process pool
+     processes: number of processes in the pool
+     runs: (start, stop) bounds of the sorted runs
+     source_memory: where the runs are
+     target_memory: where the merged runs go
+     typecode: array-module type code for the numbers
+
+    Returns:
+     count of basic operations, the merged runs
+    """
+    pairs = [runs[index:index + 2] for index in range(0, len(runs), 2)]
+    pieces_per_pair = max(1, processes//len(pairs))
+
+    tasks, merged_runs = [], []
+    view = source_memory.buf.cast(typecode)
+    try:
+        for pair in pairs:
+            left_start, left_stop = pair[0]
+            right_start, right_stop = pair[-1] if len(pair) > 1 else (left_stop,
+                                                                      left_stop)
+            merged_runs.append((left_start, right_stop))
+            total = right_stop - left_start
+            splits = [co_rank(total * piece//pieces_per_pair, view,
+                              left_start, left_stop, right_start, right_stop)
+                      for piece in range(pieces_per_pair + 1)]
+
+            for piece in range(pieces_per_pair):
+                first = total * piece//pieces_per_pair
+                last = total * (piece + 1)//pieces_per_pair
+                tasks.append((source_memory.name, target_memory.name, typecode,
+                              left_start + splits[piece],
+                              left_start + splits[piece + 1],
+                              right_start + first - splits[piece],
+                              right_start + last - splits[piece + 1],
+                              left_start + first))
+    finally:
+        view.release()
+    return sum(pool.map(_merge_piece, tasks)), merged_runs
+
+
+def _sort_run(arguments: tuple[str, str, int, int]) -> int:
+    """Sorts one chunk of the shared memory (runs in a worker process)
+
+    Args:
+     arguments: shared memory name, type code, start and stop of the chunk
+
+    Returns:
+     runtime count
+    """
+    name, typecode, start, stop = arguments
+    memory = SharedMemory(name=name)
+    try:
+        view = memory.buf.cast(typecode)
+        try:
+            chunk = view[start:stop].tolist()
+            count = bottom_up_mergesort(chunk)
+            view[start:stop] = array(typecode, chunk)
+        finally:
+            view.release()
+    finally:
+        memory.close()
+    return count
+
+
+def _merge_piece(arguments: tuple) -> int:
+    """Merges one piece of a pair of runs (runs in a worker process)
+
+    Args:
+     arguments: source and target memory names, type code, left and
+                right run bounds and where to put the piece
+
+    Returns:
+     count of basic operations
+    """
+    (source_name, target_name, typecode, left_start, left_stop,
+     right_start, right_stop, put_at) = arguments
+    source_memory = SharedMemory(name=source_name)
+    target_memory = SharedMemory(name=target_name)
+    try:
+        source = source_memory.buf.cast(typecode)
+        target = target_memory.buf.cast(typecode)
+        try:
+            count = merge(source, source, target,
+                          left_start=left_start, left_stop=left_stop,
+                          right_start=right_start, right_stop=right_stop,
+                          put_at=put_at)
+        finally:
+            source.release()
+            target.release()
+    finally:
+        source_memory.close()
+        target_memory.close()
+    return count
@@ -0,0 +1,156 @@
+# pypi
+import numpy
+
+Comparator = tuple[int, int]
+Layer = list[Comparator]
+Network = list[Layer]
+
+# Size-optimal networks (Knuth, TAOCP vol. 3, 5.3.4) grouped into layers
+# of comparators that don't share a wire
+OPTIMAL = {
+    1: [],
+    2: [[(0, 1)]],
+    3: [[(0, 2)], [(0, 1)], [(1, 2)]],
+    4: [[(0, 2), (1, 3)], [(0, 1), (2, 3)], [(1, 2)]],
+    5: [[(0, 3), (1, 4)], [(0, 2), (1, 3)], [(0, 1), (2, 4)],
+        [(1, 2), (3, 4)], [(2, 3)]],
+    6: [[(0, 5), (1, 3), (2, 4)], [(1, 2), (3, 4)], [(0, 3), (2, 5)],
+        [(0, 1), (2, 3), (4, 5)], [(1, 2), (3, 4)]],
+    7: [[(0, 6), (2, 3), (4, 5)], [(0, 2), (1, 4), (3, 6)],
+        [(0, 1), (2, 5), (3, 4)], [(1, 2), (4, 6)], [(2, 3), (4, 5)],
+        [(1, 2), (3, 4), (5, 6)]],
+    8: [[(0, 2), (1, 3), (4, 6), (5, 7)], [(0, 4), (1, 5), (2, 6), (3, 7)],
+        [(0, 1), (2, 3), (4, 5), (6, 7)], [(2, 4), (3, 5)], [(1, 4), (3, 6)],
+        [(1, 2), (3, 4), (5, 6)]],
+}
+
+LARGEST_CHECK = 20
+BLOCK_ROWS = 4096
+
+
+def bitonic_network(width: int) -> Network:
+    """Builds a bitonic sorting network for any number of wires
+
+    This is the form of Batcher's network where every comparator puts
+    the smaller value on the lower wire: each merge stage starts by
+    comparing wires that mirror each other in a block and then does
+    the usual half-cleaners. Since nothing is ever moved up past a
+    wire that isn't there, the network for the next power of two can
+    be cut down by dropping every comparator that touches a wire at or
+    past the width (which is the same as padding with infinities).
+
+    Args:
+     width: number of wires (elements in each row)
+
+    Returns:
+     layers of (low, high) comparators
+    """
+    layers = []
+    block = 2
+    while block < 2 * width:
+        layers.append([(wire, wire ^ (block - 1))
+                       for wire in range(width)
+                       if wire & (block//2) == 0
+                       and wire ^ (block - 1) < width])
+        step = block//4
+        while step > 0:
+            layers.append([(wire, wire + step)
+                           for wire in range(width)
+                           if wire & step == 0 and wire + step < width])
+            step //= 2
+        block *= 2
+    return [layer for layer in layers if layer]
+
+
+def network(width: int) -> Network:
+    """The network sort_rows uses for a width
+
+    Args:
+     width: number of wires (elements in each row)
+
+    Returns:
+     the optimal network if there is one for the width, otherwise a bitonic one
+    """
+    if width in OPTIMAL:
+        return OPTIMAL[width]
+    return bitonic_network(width)
+
+
+def _run_network(columns: numpy.ndarray, layers: Network) -> None:
+    """Runs the network down the wires of a transposed block
+
+    Args:
+     columns: 2-D array with one contiguous row per wire (changed in place)
+     layers: the network
+    """
+    smaller = numpy.empty_like(columns[0]) if len(columns) else None
+    for layer in layers:
+        for low, high in layer:
+            numpy.minimum(columns[low], columns[high], out=smaller)
+            numpy.maximum(columns[low], columns[high], out=columns[high])
+            columns[low] = smaller
+    return
+
+
+def sort_rows(rows: numpy.ndarray, in_place: bool=False,
+              block_rows: int=BLOCK_ROWS) -> numpy.ndarray:
+    """Sorts every row of a 2-D array with a sorting network
+
+    The rows are worked on in blocks which are transposed so each wire
+    (column) is a contiguous vector, then every comparator is one
+    ~numpy.minimum~ and one ~numpy.maximum~ across all the rows of the
+    block. So the python-level work depends on the width and the
+    number of blocks, not the number of rows, and the blocks are small
+    enough to stay in the cache while the whole network runs over them.
+
+    Warning:
+     NaNs spread through ~numpy.minimum~ and ~numpy.maximum~, so rows with NaNs won't come out sorted
+
+    Args:
+     rows: 2-D array, one small collection per row
+     in_place: sort the rows of the array passed in instead of a copy
+     block_rows: number of rows to put through the network at a time
+
+    Returns:
+     the array with each row sorted
+
+    Raises:
+     ValueError: rows isn't 2-D
+    """
+    rows = numpy.asarray(rows)
+    if rows.ndim != 2:
+        raise ValueError(f"Expected a 2-D array, not {rows.ndim}-D")
+    if not in_place:
+        rows = rows.copy()
+
+    layers = network(rows.shape[1])
+    for start in range(0, len(rows), block_rows):
+        block = rows[start:start + block_rows]
+        columns = numpy.ascontiguousarray(block.T)
+        _run_network(columns, layers)
+        block[...] = columns.T
+    return rows
+
+
+def check_network(layers: Network, width: int) -> bool:
+    """Checks a network with the zero-one principle
+
+    A network sorts everything if it sorts every row of zeros and ones,
+    so this runs all 2^width of them through the network.
+
+    Args:
+     layers: the network to check
+     width: number of wires
+
+    Returns:
+     True if the network sorts every input
+
+    Raises:
+     ValueError: width is too big to try every zero-one input
+    """
+    if width > LARGEST_CHECK:
+        raise ValueError(f"Width {width} would need 2^{width} rows")
+    columns = ((numpy.arange(2**width) >> numpy.arange(width)[:, None])
+               & 1).astype(numpy.uint8)
+    _run_network(columns, layers)
+    return bool((columns[:-1] <= columns[1:]).all())
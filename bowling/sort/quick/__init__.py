@@ -1,3 +1,16 @@
 from .partition_levitin import partition_levitin as levitins_partition
 from .partition_clrs import partition_clrs as clrs_partition
 from .partition_randomized import partition_randomized as randomized_partition
+from .partition_levitin import partition_levitin_counter as levitins_partition_counter
+from .partition_clrs import partition_clrs_counter as clrs_partition_counter
+from .partition_three_way import partition_three_way as three_way_partition
+from .partition_three_way import partition_three_way_counter as three_way_partition_counter
+from .partition_dual_pivot import partition_dual_pivot as dual_pivot_partition
+from .partition_dual_pivot import partition_dual_pivot_counter as dual_pivot_partition_counter
+from .partition_output import PartitionOutput
+from .partition_dual_pivot import DualPivotOutput
+from .partition_three_way import ThreeWayOutput
+from .quicksort import (introsort, introsort_dual_pivot, introsort_three_way,
+                        QuicksortOutput,
+                        randomized_clrs_counter, randomized_dual_pivot_counter,
+                        randomized_levitin_counter, randomized_three_way_counter)
@@ -1,6 +1,12 @@
 # python
 from collections.abc import MutableSequence
 
+# this project
+from bowling.sort import kernels
+
+# this package
+from .partition_output import PartitionOutput
+
 
 def partition_clrs(collection: MutableSequence, left: int, right: int) -> int:
     """Partitions the collection around the last element
@@ -13,6 +19,9 @@ def partition_clrs(collection: MutableSequence, left: int, right: int) -> int:
     Returns:
      the index of the pivot element
     """
+    if kernels.use_kernel(collection):
+        return kernels.partition_clrs(collection, left, right)[0]
+
     pivot_element = collection[right]
     lower_bound = left - 1
     for upper_bound in range(left, right):
@@ -26,3 +35,37 @@ def partition_clrs(collection: MutableSequence, left: int, right: int) -> int:
      collection[right]) = (collection[right],
                            collection[pivot])
     return pivot
+
+
+def partition_clrs_counter(collection: MutableSequence,
+                           left: int, right: int) -> PartitionOutput:
+    """Partitions the collection around the last element and counts
+
+    Args:
+     collection: the list to partition
+     left: index of the first element in the sub-list to partition
+     right: index of the last element in the sub-list to partition
+
+    Returns:
+     pivot index, count of comparisons, count of swaps
+    """
+    if kernels.use_kernel(collection):
+        return PartitionOutput(*kernels.partition_clrs(collection, left, right))
+
+    pivot_element = collection[right]
+    lower_bound = left - 1
+    swaps = 0
+    for upper_bound in range(left, right):
+        if collection[upper_bound] <= pivot_element:
+            lower_bound += 1
+            (collection[lower_bound],
+             collection[upper_bound]) = (collection[upper_bound],
+                                         collection[lower_bound])
+            swaps += lower_bound != upper_bound
+    pivot = lower_bound + 1
+    (collection[pivot],
+     collection[right]) = (collection[right],
+                           collection[pivot])
+    swaps += pivot != right
+    return PartitionOutput(pivot=pivot, comparisons=right - left,
+                           swaps=swaps)
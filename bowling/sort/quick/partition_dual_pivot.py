@@ -0,0 +1,121 @@
+# python
+from collections import namedtuple
+from collections.abc import MutableSequence
+
+DualPivotOutput = namedtuple("DualPivotOutput", ["lower_pivot",
+                                                 "upper_pivot",
+                                                 "comparisons",
+                                                 "swaps"])
+
+
+def partition_dual_pivot(collection: MutableSequence,
+                         left: int, right: int) -> tuple[int, int]:
+    """Partitions the collection around the first and last elements
+
+    This is Yaroslavskiy's partition - after it's done everything left
+    of the lower pivot is less than it, everything right of the upper
+    pivot is greater than it and everything between is in [lower, upper].
+
+    Args:
+     collection: the list to partition (at least two elements)
+     left: index of the first element in the sub-list to partition
+     right: index of the last element in the sub-list to partition
+
+    Returns:
+     (lower, upper) indices of the two pivot elements
+    """
+    if collection[right] < collection[left]:
+        collection[left], collection[right] = (collection[right],
+                                               collection[left])
+    lower_pivot, upper_pivot = collection[left], collection[right]
+    less, great = left + 1, right - 1
+    next_unknown = less
+
+    while next_unknown <= great:
+        if collection[next_unknown] < lower_pivot:
+            collection[next_unknown], collection[less] = (
+                collection[less], collection[next_unknown])
+            less += 1
+        elif collection[next_unknown] > upper_pivot:
+            while (collection[great] > upper_pivot and
+                   next_unknown < great):
+                great -= 1
+            collection[next_unknown], collection[great] = (
+                collection[great], collection[next_unknown])
+            great -= 1
+            if collection[next_unknown] < lower_pivot:
+                collection[next_unknown], collection[less] = (
+                    collection[less], collection[next_unknown])
+                less += 1
+        next_unknown += 1
+
+    less, great = less - 1, great + 1
+    collection[left], collection[less] = collection[less], collection[left]
+    collection[right], collection[great] = (collection[great],
+                                            collection[right])
+    return less, great
+
+
+def partition_dual_pivot_counter(collection: MutableSequence,
+                                 left: int, right: int) -> DualPivotOutput:
+    """Does the dual-pivot partition and counts comparisons and swaps
+
+    Swaps are counted the same way as the other partition counters -
+    every exchange of two different elements, including the final moves
+    of the two pivots (unless they're already in place).
+
+    Args:
+     collection: the list to partition (at least two elements)
+     left: index of the first element in the sub-list to partition
+     right: index of the last element in the sub-list to partition
+
+    Returns:
+     index of the lower pivot, index of the upper pivot, comparisons, swaps
+    """
+    comparisons = 1
+    swaps = 0
+    if collection[right] < collection[left]:
+        collection[left], collection[right] = (collection[right],
+                                               collection[left])
+        swaps += 1
+    lower_pivot, upper_pivot = collection[left], collection[right]
+    less, great = left + 1, right - 1
+    next_unknown = less
+
+    while next_unknown <= great:
+        comparisons += 1
+        if collection[next_unknown] < lower_pivot:
+            collection[next_unknown], collection[less] = (
+                collection[less], collection[next_unknown])
+            swaps += next_unknown != less
+            less += 1
+            next_unknown += 1
+            continue
+
+        comparisons += 1
+        if collection[next_unknown] > upper_pivot:
+            while True:
+                comparisons += 1
+                if not (collection[great] > upper_pivot and
+                        next_unknown < great):
+                    break
+                great -= 1
+            collection[next_unknown], collection[great] = (
+                collection[great], collection[next_unknown])
+            swaps += next_unknown != great
+            great -= 1
+            comparisons += 1
+            if collection[next_unknown] < lower_pivot:
+                collection[next_unknown], collection[less] = (
+                    collection[less], collection[next_unknown])
+                swaps += next_unknown != less
+                less += 1
+        next_unknown += 1
+
+    less, great = less - 1, great + 1
+    collection[left], collection[less] = collection[less], collection[left]
+    collection[right], collection[great] = (collection[great],
+                                            collection[right])
+    swaps += (less != left) + (great != right)
+    return DualPivotOutput(lower_pivot=less, upper_pivot=great,
+                           comparisons=comparisons, swaps=swaps)
@@ -1,6 +1,12 @@
 # python
 from collections.abc import MutableSequence
 
+# this project
+from bowling.sort import kernels
+
+# this package
+from .partition_output import PartitionOutput
+
 
 def partition_levitin(collection: MutableSequence,
                       left: int, right: int) -> int:
@@ -14,6 +20,9 @@ def partition_levitin(collection: MutableSequence,
     Returns:
      the index of the pivot element
     """
+    if kernels.use_kernel(collection):
+        return kernels.partition_levitin(collection, left, right)[0]
+
     pivot_element = collection[left]
     partition_left = left
     partition_right = right + 1
@@ -45,3 +54,53 @@ def partition_levitin(collection: MutableSequence,
     )
 
     return partition_right
+
+
+def partition_levitin_counter(collection: MutableSequence,
+                              left: int, right: int) -> PartitionOutput:
+    """Partitions the collection around the first element and counts
+
+    Args:
+     collection: the list to partition
+     left: index of the first element in the sub-list to partition
+     right: index of the last element in the sub-list to partition
+
+    Returns:
+     pivot index, count of comparisons, count of swaps
+    """
+    if kernels.use_kernel(collection):
+        return PartitionOutput(*kernels.partition_levitin(collection, left, right))
+
+    pivot_element = collection[left]
+    partition_left = left
+    partition_right = right + 1
+    comparisons = swaps = 0
+
+    while True:
+        while partition_left < right:
+            partition_left += 1
+            comparisons += 1
+            if collection[partition_left] >= pivot_element:
+                break
+
+        while True:
+            partition_right -= 1
+            comparisons += 1
+            if collection[partition_right] <= pivot_element:
+                break
+
+        if partition_left >= partition_right:
+            break
+
+        collection[partition_left], collection[partition_right] = (
+            collection[partition_right], collection[partition_left]
+        )
+        swaps += 1
+
+    collection[left], collection[partition_right] = (
+        collection[partition_right], collection[left]
+    )
+    swaps += partition_right != left
+
+    return PartitionOutput(pivot=partition_right, comparisons=comparisons,
+                           swaps=swaps)
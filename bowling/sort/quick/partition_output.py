@@ -0,0 +1,6 @@
+# python
+from collections import namedtuple
+
+PartitionOutput = namedtuple("PartitionOutput", ["pivot",
+                                                 "comparisons",
+                                                 "swaps"])
@@ -0,0 +1,89 @@
+# python
+from collections import namedtuple
+from collections.abc import MutableSequence
+
+# this project
+from bowling.sort import kernels
+
+ThreeWayOutput = namedtuple("ThreeWayOutput", ["lower",
+                                               "upper",
+                                               "comparisons",
+                                               "swaps"])
+
+
+def partition_three_way(collection: MutableSequence,
+                        left: int, right: int) -> tuple[int, int]:
+    """Partitions the collection into less-than, equal-to and greater-than
+
+    This is Dijkstra's Dutch National Flag partition using the first
+    element as the pivot.
+
+    Args:
+     collection: the list to partition
+     left: index of the first element in the sub-list to partition
+     right: index of the last element in the sub-list to partition
+
+    Returns:
+     (lower, upper) indices of the first and last elements equal to the pivot
+    """
+    if kernels.use_kernel(collection):
+        return kernels.partition_three_way(collection, left, right)[:2]
+
+    pivot_element = collection[left]
+    lower, next_unknown, upper = left, left + 1, right
+
+    while next_unknown <= upper:
+        if collection[next_unknown] < pivot_element:
+            collection[lower], collection[next_unknown] = (
+                collection[next_unknown], collection[lower])
+            lower += 1
+            next_unknown += 1
+        elif collection[next_unknown] > pivot_element:
+            collection[next_unknown], collection[upper] = (
+                collection[upper], collection[next_unknown])
+            upper -= 1
+        else:
+            next_unknown += 1
+    return lower, upper
+
+
+def partition_three_way_counter(collection: MutableSequence,
+                                left: int, right: int) -> ThreeWayOutput:
+    """Does the three-way partition and counts the comparisons and swaps
+
+    Args:
+     collection: the list to partition
+     left: index of the first element in the sub-list to partition
+     right: index of the last element in the sub-list to partition
+
+    Returns:
+     first and last index of the pivot block, comparisons, swaps
+    """
+    if kernels.use_kernel(collection):
+        return ThreeWayOutput(*kernels.partition_three_way(collection, left,
+                                                           right))
+
+    pivot_element = collection[left]
+    lower, next_unknown, upper = left, left + 1, right
+    comparisons = swaps = 0
+
+    while next_unknown <= upper:
+        comparisons += 1
+        if collection[next_unknown] < pivot_element:
+            collection[lower], collection[next_unknown] = (
+                collection[next_unknown], collection[lower])
+            swaps += lower != next_unknown
+            lower += 1
+            next_unknown += 1
+            continue
+
+        comparisons += 1
+        if collection[next_unknown] > pivot_element:
+            collection[next_unknown], collection[upper] = (
+                collection[upper], collection[next_unknown])
+            swaps += next_unknown != upper
+            upper -= 1
+        else:
+            next_unknown += 1
+    return ThreeWayOutput(lower=lower, upper=upper,
+                          comparisons=comparisons, swaps=swaps)
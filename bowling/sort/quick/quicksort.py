@@ -0,0 +1,344 @@
+# python
+from collections import namedtuple
+from math import log2
+from typing import Callable, MutableSequence, TypeVar
+
+import random
+
+# this project
+from bowling.sort.heap import heapsort
+from bowling.sort.insertion import binary_insertion_sort
+from bowling.sort.keys import keyed
+
+# this package
+from .partition_clrs import partition_clrs_counter
+from .partition_dual_pivot import DualPivotOutput, partition_dual_pivot_counter
+from .partition_levitin import partition_levitin_counter
+from .partition_output import PartitionOutput
+from .partition_three_way import ThreeWayOutput, partition_three_way_counter
+
+Orderable = TypeVar("Orderable")
+CountingPartition = Callable[[MutableSequence[Orderable], int, int],
+                             PartitionOutput]
+ThreeWayPartition = Callable[[MutableSequence[Orderable], int, int],
+                             ThreeWayOutput]
+DualPivotPartition = Callable[[MutableSequence[Orderable], int, int],
+                              DualPivotOutput]
+
+QuicksortOutput = namedtuple("QuicksortOutput", ["element_count",
+                                                 "comparisons",
+                                                 "swaps",
+                                                 "elements"])
+
+SMALL_SLICE = 32
+
+
+def _swap_in_random(collection: MutableSequence[Orderable], left: int,
+                    right: int, pivot: int) -> int:
+    """Swaps a randomly picked element of the sub-list into the pivot's place
+
+    Args:
+     collection: the list to partition
+     left: index of the first element the pick can come from
+     right: index of the last element the pick can come from
+     pivot: where to put the picked element
+
+    Returns:
+     count of swaps (0 if the element picked was already there)
+    """
+    random_index = random.randrange(left, right + 1)
+    collection[pivot], collection[random_index] = (collection[random_index],
+                                                   collection[pivot])
+    return int(random_index != pivot)
+
+
+def randomized_clrs_counter(collection: MutableSequence[Orderable],
+                            left: int, right: int) -> PartitionOutput:
+    """Swaps a random element to the end then does the CLRS partition
+
+    Args:
+     collection: the list to partition
+     left: index of the first element in the sub-list to partition
+     right: index of the last element in the sub-list to partition
+
+    Returns:
+     pivot index, count of comparisons, count of swaps
+    """
+    swaps = _swap_in_random(collection, left, right, pivot=right)
+    output = partition_clrs_counter(collection, left, right)
+    return output._replace(swaps=output.swaps + swaps)
+
+
+def randomized_levitin_counter(collection: MutableSequence[Orderable],
+                               left: int, right: int) -> PartitionOutput:
+    """Swaps a random element to the front then does Levitin's partition
+
+    Args:
+     collection: the list to partition
+     left: index of the first element in the sub-list to partition
+     right: index of the last element in the sub-list to partition
+
+    Returns:
+     pivot index, count of comparisons, count of swaps
+    """
+    swaps = _swap_in_random(collection, left, right, pivot=left)
+    output = partition_levitin_counter(collection, left, right)
+    return output._replace(swaps=output.swaps + swaps)
+
+
+def randomized_three_way_counter(collection: MutableSequence[Orderable],
+                                 left: int, right: int) -> ThreeWayOutput:
+    """Swaps a random element to the front then does the three-way partition
+
+    Args:
+     collection: the list to partition
+     left: index of the first element in the sub-list to partition
+     right: index of the last element in the sub-list to partition
+
+    Returns:
+     first and last index of the pivot block, comparisons, swaps
+    """
+    swaps = _swap_in_random(collection, left, right, pivot=left)
+    output = partition_three_way_counter(collection, left, right)
+    return output._replace(swaps=output.swaps + swaps)
+
+
+def randomized_dual_pivot_counter(collection: MutableSequence[Orderable],
+                                  left: int, right: int) -> DualPivotOutput:
+    """Swaps random elements to both ends then does the dual-pivot partition
+
+    Args:
+     collection: the list to partition (at least two elements)
+     left: index of the first element in the sub-list to partition
+     right: index of the last element in the sub-list to partition
+
+    Returns:
+     index of the lower pivot, index of the upper pivot, comparisons, swaps
+    """
+    swaps = (_swap_in_random(collection, left, right, pivot=left)
+             + _swap_in_random(collection, left + 1, right, pivot=right))
+    output = partition_dual_pivot_counter(collection, left, right)
+    return output._replace(swaps=output.swaps + swaps)
+
+
+@keyed
+def introsort(elements: MutableSequence[Orderable],
+              partition: CountingPartition=randomized_clrs_counter,
+              small_slice: int=SMALL_SLICE) -> QuicksortOutput:
+    """Quicksort that bails out to heapsort when the recursion gets too deep
+
+    Sub-lists with ~small_slice~ or fewer elements are finished with binary
+    insertion sort and once the partitioning has gone 2 log2(n) levels
+    deep the remaining sub-list is heapsorted, so the worst case is
+    O(n log n).
+
+    The swaps are the exchanges of two different elements made by the
+    partitions and the heapsort. The insertion sort shifts elements
+    instead of swapping them so its moves aren't counted.
+
+    Args:
+     elements: list to sort (in place)
+     partition: one of the partition counters (clrs, levitin, or randomized)
+     small_slice: size at or below which sub-lists are insertion sorted
+
+    Returns:
+     count of elements, comparisons made, swaps made, sorted elements
+    """
+    size = len(elements)
+    comparisons = swaps = 0
+    if size > 1:
+        depth_limit = 2 * int(log2(size))
+        comparisons, swaps = _introsort(elements, 0, size - 1, depth_limit,
+                                        partition, small_slice)
+    return QuicksortOutput(size, comparisons, swaps, elements)
+
+
+def _introsort(elements: MutableSequence[Orderable], left: int, right: int,
+               depth_limit: int, partition: CountingPartition,
+               small_slice: int) -> tuple[int, int]:
+    """Sorts the sub-list, recursing only into the smaller side
+
+    Args:
+     elements: list to sort
+     left: index of the first element of the sub-list
+     right: index of the last element of the sub-list
+     depth_limit: number of partitions left before switching to heapsort
+     partition: the partition counter to use
+     small_slice: size at or below which sub-lists are insertion sorted
+
+    Returns:
+     count of comparisons, count of swaps
+    """
+    comparisons = swaps = 0
+    while right - left + 1 > small_slice:
+        if depth_limit == 0:
+            output = heapsort(elements, left, right)
+            return comparisons + output.comparisons, swaps + output.swaps
+
+        depth_limit -= 1
+        output = partition(elements, left, right)
+        comparisons += output.comparisons
+        swaps += output.swaps
+
+        # recursing on the smaller side keeps the stack O(log n) deep
+        if output.pivot - left < right - output.pivot:
+            side_comparisons, side_swaps = _introsort(
+                elements, left, output.pivot - 1, depth_limit,
+                partition, small_slice)
+            left = output.pivot + 1
+        else:
+            side_comparisons, side_swaps = _introsort(
+                elements, output.pivot + 1, right, depth_limit,
+                partition, small_slice)
+            right = output.pivot - 1
+        comparisons += side_comparisons
+        swaps += side_swaps
+
+    output = binary_insertion_sort(elements, left, right)
+    return comparisons + output.comparisons, swaps
+
+
+@keyed
+def introsort_three_way(
+        elements: MutableSequence[Orderable],
+        partition: ThreeWayPartition=randomized_three_way_counter,
+        small_slice: int=SMALL_SLICE) -> QuicksortOutput:
+    """Introsort that uses a three-way partition
+
+    The block of elements equal to the pivot is already in its final
+    place after the partition so only the less-than and greater-than
+    sides get sorted, which keeps duplicate-heavy inputs from going
+    quadratic.
+
+    Args:
+     elements: list to sort (in place)
+     partition: a three-way partition counter
+     small_slice: size at or below which sub-lists are insertion sorted
+
+    Returns:
+     count of elements, comparisons made, swaps made, sorted elements
+    """
+    size = len(elements)
+    comparisons = swaps = 0
+    if size > 1:
+        depth_limit = 2 * int(log2(size))
+        comparisons, swaps = _introsort_three_way(
+            elements, 0, size - 1, depth_limit, partition, small_slice)
+    return QuicksortOutput(size, comparisons, swaps, elements)
+
+
+def _introsort_three_way(elements: MutableSequence[Orderable],
+                         left: int, right: int, depth_limit: int,
+                         partition: ThreeWayPartition,
+                         small_slice: int) -> tuple[int, int]:
+    """Sorts the sub-list, skipping the block equal to the pivot
+
+    Args:
+     elements: list to sort
+     left: index of the first element of the sub-list
+     right: index of the last element of the sub-list
+     depth_limit: number of partitions left before switching to heapsort
+     partition: the three-way partition counter to use
+     small_slice: size at or below which sub-lists are insertion sorted
+
+    Returns:
+     count of comparisons, count of swaps
+    """
+    comparisons = swaps = 0
+    while right - left + 1 > small_slice:
+        if depth_limit == 0:
+            output = heapsort(elements, left, right)
+            return comparisons + output.comparisons, swaps + output.swaps
+
+        depth_limit -= 1
+        output = partition(elements, left, right)
+        comparisons += output.comparisons
+        swaps += output.swaps
+
+        if output.lower - left < right - output.upper:
+            side_comparisons, side_swaps = _introsort_three_way(
+                elements, left, output.lower - 1, depth_limit,
+                partition, small_slice)
+            left = output.upper + 1
+        else:
+            side_comparisons, side_swaps = _introsort_three_way(
+                elements, output.upper + 1, right, depth_limit,
+                partition, small_slice)
+            right = output.lower - 1
+        comparisons += side_comparisons
+        swaps += side_swaps
+
+    output = binary_insertion_sort(elements, left, right)
+    return comparisons + output.comparisons, swaps
+
+
+@keyed
+def introsort_dual_pivot(
+        elements: MutableSequence[Orderable],
+        partition: DualPivotPartition=randomized_dual_pivot_counter,
+        small_slice: int=SMALL_SLICE) -> QuicksortOutput:
+    """Introsort that splits each sub-list into three with two pivots
+
+    Args:
+     elements: list to sort (in place)
+     partition: a dual-pivot partition counter
+     small_slice: size at or below which sub-lists are insertion sorted
+
+    Returns:
+     count of elements, comparisons made, swaps made, sorted elements
+    """
+    size = len(elements)
+    comparisons = swaps = 0
+    if size > 1:
+        depth_limit = 2 * int(log2(size))
+        comparisons, swaps = _introsort_dual_pivot(
+            elements, 0, size - 1, depth_limit, partition, small_slice)
+    return QuicksortOutput(size, comparisons, swaps, elements)
+
+
+def _introsort_dual_pivot(elements: MutableSequence[Orderable],
+                          left: int, right: int, depth_limit: int,
+                          partition: DualPivotPartition,
+                          small_slice: int) -> tuple[int, int]:
+    """Sorts the two smaller thirds recursively and loops on the biggest
+
+    Args:
+     elements: list to sort
+     left: index of the first element of the sub-list
+     right: index of the last element of the sub-list
+     depth_limit: number of partitions left before switching to heapsort
+     partition: the dual-pivot partition counter to use
+     small_slice: size at or below which sub-lists are insertion sorted
+
+    Returns:
+     count of comparisons, count of swaps
+    """
+    comparisons = swaps = 0
+    while right - left + 1 > small_slice:
+        if depth_limit == 0:
+            output = heapsort(elements, left, right)
+            return comparisons + output.comparisons, swaps + output.swaps
+
+        depth_limit -= 1
+        output = partition(elements, left, right)
+        comparisons += output.comparisons + 1
+        swaps += output.swaps
+
+        thirds = [(left, output.lower_pivot - 1),
+                  (output.upper_pivot + 1, right)]
+
+        # if the pivots are equal the middle is all copies of them
+        if elements[output.lower_pivot] < elements[output.upper_pivot]:
+            thirds.append((output.lower_pivot + 1, output.upper_pivot - 1))
+
+        thirds.sort(key=lambda third: third[1] - third[0])
+        for third_left, third_right in thirds[:-1]:
+            third_comparisons, third_swaps = _introsort_dual_pivot(
+                elements, third_left, third_right, depth_limit,
+                partition, small_slice)
+            comparisons += third_comparisons
+            swaps += third_swaps
+        left, right = thirds[-1]
+
+    output = binary_insertion_sort(elements, left, right)
+    return comparisons + output.comparisons, swaps
@@ -0,0 +1,183 @@
+# pypi
+import numpy
+
+DEFAULT_RADIX_BITS = 16
+RADIX_BITS = (8, 16)
+MAX_COUNTING_RANGE = 2**24
+
+UNSIGNED = {1: numpy.uint8, 2: numpy.uint16, 4: numpy.uint32, 8: numpy.uint64}
+
+
+def order_preserving_keys(values: numpy.ndarray) -> numpy.ndarray:
+    """Re-interprets the values as unsigned integers that sort the same way
+
+    Signed integers get their sign bit flipped. Floats get their sign bit
+    flipped if they're positive and all their bits flipped if they're
+    negative (so bigger negative numbers end up smaller). This puts -0.0
+    just before 0.0, and NaNs after infinity (or before negative
+    infinity if the NaN's sign bit is set).
+
+    Args:
+     values: array of booleans, integers or floats
+
+    Returns:
+     unsigned integer keys of the same width
+
+    Raises:
+     TypeError: the values aren't booleans, integers or floats (of up to 64 bits)
+    """
+    values = numpy.asarray(values)
+    kind = values.dtype.kind
+    if kind not in "biuf" or values.dtype.itemsize not in UNSIGNED:
+        raise TypeError(f"Can't make radix keys for dtype {values.dtype}")
+    if kind == "b":
+        return values.view(numpy.uint8)
+    if kind == "u":
+        return values
+
+    unsigned = UNSIGNED[values.dtype.itemsize]
+    sign_bit = unsigned(1) << unsigned(8 * values.dtype.itemsize - 1)
+    bits = values.view(unsigned)
+    if kind == "i":
+        return bits ^ sign_bit
+    return numpy.where(bits & sign_bit, ~bits, bits | sign_bit)
+
+
+def _counting_offsets(values: numpy.ndarray) -> tuple[numpy.ndarray, int]:
+    """Checks the values can be counted and makes their offsets
+
+    Args:
+     values: array of booleans or integers
+
+    Returns:
+     unsigned keys minus the smallest key, the smallest key
+
+    Raises:
+     TypeError: the values aren't booleans or integers
+    """
+    if values.dtype.kind not in "biu":
+        raise TypeError(f"Counting sort needs booleans or integers, not {values.dtype}")
+    keys = order_preserving_keys(values)
+    smallest = keys.min()
+    return keys - smallest, smallest
+
+
+def counting_sort(values: numpy.ndarray) -> numpy.ndarray:
+    """Sorts integers by counting how many there are of each value
+
+    This is meant for integers with a small range (like ratings or
+    bucket IDs) since the histogram has one bin per value between the
+    smallest and the largest. If the range is wider than
+    MAX_COUNTING_RANGE the values get the radix sort instead.
+
+    Args:
+     values: array of booleans or integers
+
+    Returns:
+     new array with the values sorted
+
+    Raises:
+     TypeError: the values aren't booleans or integers
+    """
+    values = numpy.asarray(values)
+    if not len(values):
+        return values.copy()
+
+    offsets, smallest = _counting_offsets(values)
+    if offsets.max() >= MAX_COUNTING_RANGE:
+        return radix_sort(values)
+    counts = numpy.bincount(offsets.astype(numpy.intp))
+    sorted_keys = numpy.repeat(
+        numpy.arange(len(counts), dtype=offsets.dtype) + smallest, counts)
+    if values.dtype.kind == "i":
+        unsigned = offsets.dtype.type
+        sorted_keys ^= unsigned(1) << unsigned(8 * offsets.dtype.itemsize - 1)
+    return sorted_keys.view(values.dtype)
+
+
+def counting_argsort(values: numpy.ndarray) -> numpy.ndarray:
+    """Stable argsort of small-range integers
+
+    The values are shifted down so the smallest is zero and stored in
+    the narrowest unsigned type that holds the range, then handed to
+    ~radix_argsort~. With a range under 2^16 that's a single stable
+    sort of 16-bit digits, which numpy does as a counting sort, so this
+    is O(n + range) and wider ranges only add a pass per 16 bits.
+
+    Args:
+     values: array of booleans or integers
+
+    Returns:
+     indices that would sort the values (ties keep their original order)
+
+    Raises:
+     TypeError: the values aren't booleans or integers
+    """
+    values = numpy.asarray(values)
+    if not len(values):
+        return numpy.empty(0, dtype=numpy.intp)
+
+    offsets, _ = _counting_offsets(values)
+    narrowest = numpy.min_scalar_type(int(offsets.max()))
+    return radix_argsort(offsets.astype(narrowest))
+
+
+def radix_argsort(values: numpy.ndarray,
+                  radix_bits: int=DEFAULT_RADIX_BITS) -> numpy.ndarray:
+    """Stable least-significant-digit radix argsort
+
+    The values are turned into order-preserving unsigned keys which are
+    then sorted one digit at a time from the lowest. Each pass starts
+    with a histogram of the digit and is skipped if every key has the
+    same digit (which is common for IDs that don't use the high bits),
+    otherwise the keys are stably scattered by that digit. The scatter
+    uses numpy's stable sort on the 8 or 16 bit digits, which numpy
+    does as a counting sort, so each pass is O(n).
+
+    Args:
+     values: array of booleans, integers or floats
+     radix_bits: number of bits in each digit (8 or 16)
+
+    Returns:
+     indices that would sort the values (ties keep their original order)
+
+    Raises:
+     ValueError: radix_bits isn't 8 or 16
+    """
+    if radix_bits not in RADIX_BITS:
+        raise ValueError(f"radix_bits has to be 8 or 16, not {radix_bits}")
+    keys = order_preserving_keys(values)
+    items = len(keys)
+    order = numpy.arange(items)
+    if items < 2:
+        return order
+
+    radix_bits = min(radix_bits, 8 * keys.dtype.itemsize)
+    digit_type = numpy.uint8 if radix_bits <= 8 else numpy.uint16
+    mask = keys.dtype.type((1 << radix_bits) - 1)
+    for shift in range(0, 8 * keys.dtype.itemsize, radix_bits):
+        digits = ((keys[order] >> keys.dtype.type(shift))
+                  & mask).astype(digit_type)
+        histogram = numpy.bincount(digits, minlength=1 << radix_bits)
+        if histogram.max() == items:
+            continue
+        order = order[numpy.argsort(digits, kind="stable")]
+    return order
+
+
+def radix_sort(values: numpy.ndarray,
+               radix_bits: int=DEFAULT_RADIX_BITS) -> numpy.ndarray:
+    """Stable least-significant-digit radix sort
+
+    Args:
+     values: array of booleans, integers or floats
+     radix_bits: number of bits in each digit (8 or 16)
+
+    Returns:
+     new array with the values sorted
+
+    Raises:
+     ValueError: radix_bits isn't 8 or 16
+    """
+    values = numpy.asarray(values)
+    return values[radix_argsort(values, radix_bits)]
@@ -0,0 +1,208 @@
+# python
+from collections.abc import MutableSequence, Sequence
+from math import ceil, log2
+from typing import TypeVar
+
+import random
+
+# this project
+from bowling.sort.heap import heapsort
+from bowling.sort.insertion import insertion_sort
+from bowling.sort.quick.partition_clrs import partition_clrs
+from bowling.sort.quick.partition_randomized import partition_randomized
+from bowling.sort.quick.partition_three_way import partition_three_way
+
+Orderable = TypeVar("Orderable")
+
+GROUP_SIZE = 5
+SMALL_SLICE = 16
+
+
+def quickselect(collection: MutableSequence[Orderable], k: int) -> Orderable:
+    """Finds the kth smallest item using randomized partitions
+
+    If the partitions keep coming out lopsided (more than 2 log2(n) of
+    them) the rest of the search is handed to median-of-medians so the
+    worst case stays linear.
+
+    Warning:
+     the collection gets rearranged
+
+    Args:
+     collection: the items to search
+     k: the order statistic to find (1 is the minimum, n is the maximum)
+
+    Returns:
+     the kth smallest item
+
+    Raises:
+     IndexError: k isn't between 1 and the number of items
+    """
+    items = len(collection)
+    if not 1 <= k <= items:
+        raise IndexError(f"k={k} not in the range 1 to {items}")
+
+    target = k - 1
+    left, right = 0, items - 1
+    partitions_left = 2 * int(log2(items)) + 1
+    while left < right:
+        if not partitions_left:
+            return median_of_medians(collection, target - left + 1, left, right)
+        partitions_left -= 1
+        pivot = partition_randomized(collection, left, right, pivot=right,
+                                     partition=partition_clrs)
+        if pivot == target:
+            break
+        if target < pivot:
+            right = pivot - 1
+        else:
+            left = pivot + 1
+    return collection[target]
+
+
+def median_of_medians(collection: MutableSequence[Orderable], k: int,
+                      left: int=0, right: int=None) -> Orderable:
+    """Finds the kth smallest item in the sub-list in worst-case linear time
+
+    The pivot is the median of the medians of groups of five, which
+    guarantees each partition throws away at least about 3/10 of the
+    items. The partition is three-way so duplicates don't slow it down.
+
+    Warning:
+     the sub-list gets rearranged
+
+    Args:
+     collection: the items to search
+     k: the order statistic to find within the sub-list (1 is its minimum)
+     left: index of the first item of the sub-list
+     right: index of the last item of the sub-list (default is the end)
+
+    Returns:
+     the kth smallest item of the sub-list
+
+    Raises:
+     IndexError: k isn't between 1 and the size of the sub-list
+    """
+    if right is None:
+        right = len(collection) - 1
+    if not 1 <= k <= right - left + 1:
+        raise IndexError(f"k={k} not in the range 1 to {right - left + 1}")
+
+    target = left + k - 1
+    while right - left + 1 > GROUP_SIZE:
+        medians = left
+        for group in range(left, right + 1, GROUP_SIZE):
+            group_end = min(group + GROUP_SIZE - 1, right)
+            insertion_sort(collection, group, group_end)
+            middle = (group + group_end)//2
+            collection[medians], collection[middle] = (collection[middle],
+                                                       collection[medians])
+            medians += 1
+
+        # the medians are now at the front so find their median in place
+        median_of_medians(collection, (medians - left + 1)//2, left,
+                          medians - 1)
+        pivot = left + (medians - left - 1)//2
+        collection[left], collection[pivot] = (collection[pivot],
+                                               collection[left])
+
+        lower, upper = partition_three_way(collection, left, right)
+        if lower <= target <= upper:
+            return collection[target]
+        if target < lower:
+            right = lower - 1
+        else:
+            left = upper + 1
+
+    insertion_sort(collection, left, right)
+    return collection[target]
+
+
+def select_ranks(collection: MutableSequence[Orderable],
+                 ranks: Sequence[int]) -> list[Orderable]:
+    """Finds several order statistics with one round of partitioning
+
+    Each partition splits the wanted ranks between its two sides and
+    only the sides that still have ranks in them get partitioned again,
+    so the partitions near the top are shared by all the ranks.
+
+    Warning:
+     the collection gets rearranged
+
+    Args:
+     collection: the items to search
+     ranks: the order statistics to find (1 is the minimum, n is the maximum)
+
+    Returns:
+     the item for each rank, in the same order as the ranks
+
+    Raises:
+     IndexError: one of the ranks isn't between 1 and the number of items
+    """
+    items = len(collection)
+    for k in ranks:
+        if not 1 <= k <= items:
+            raise IndexError(f"k={k} not in the range 1 to {items}")
+
+    if ranks:
+        targets = sorted({k - 1 for k in ranks})
+        _select_targets(collection, 0, items - 1, targets,
+                        2 * int(log2(items)) + 1)
+    return [collection[k - 1] for k in ranks]
+
+
+def percentiles(collection: MutableSequence[Orderable],
+                *percents: float) -> list[Orderable]:
+    """Finds the items at the percentiles (nearest-rank method)
+
+    Warning:
+     the collection gets rearranged
+
+    Args:
+     collection: the items to search
+     percents: the percentiles to get (e.g. 50, 90, 99)
+
+    Returns:
+     the item at each percentile, in the order given
+    """
+    items = len(collection)
+    return select_ranks(collection,
+                        [max(1, ceil(percent * items/100))
+                         for percent in percents])
+
+
+def _select_targets(collection: MutableSequence[Orderable], left: int,
+                    right: int, targets: list[int],
+                    depth_limit: int) -> None:
+    """Partitions the sub-list until every target index holds its item
+
+    Args:
+     collection: the items to search
+     left: index of the first item of the sub-list
+     right: index of the last item of the sub-list
+     targets: sorted indices (within the sub-list) to settle
+     depth_limit: partitions left before the sub-list just gets heapsorted
+    """
+    while targets:
+        if right - left + 1 <= SMALL_SLICE:
+            insertion_sort(collection, left, right)
+            return
+        if not depth_limit:
+            heapsort(collection, left, right)
+            return
+        depth_limit -= 1
+
+        random_index = random.randrange(left, right + 1)
+        collection[left], collection[random_index] = (collection[random_index],
+                                                      collection[left])
+        lower, upper = partition_three_way(collection, left, right)
+
+        below = [target for target in targets if target < lower]
+        above = [target for target in targets if target > upper]
+        if len(below) < len(above):
+            _select_targets(collection, left, lower - 1, below, depth_limit)
+            left, targets = upper + 1, above
+        else:
+            _select_targets(collection, upper + 1, right, above, depth_limit)
+            right, targets = lower - 1, below
+    return
@@ -1,15 +1,21 @@
 from collections.abc import MutableSequence
 from collections import namedtuple
-from typing import Any, Dict
+from typing import Any
+
+# this project
+from bowling.sort import kernels
+from bowling.sort.keys import keyed
+from bowling.sort.trace import SwapTrace
+
 SelectionOutput = namedtuple("SelectionOutput",
                              ["element_count",
                               "comparisons",
                               "swaps",
                               "elements"])
-Swaps = Dict[int, list[int]]
 Sortable = MutableSequence[Any]
 
 
+@keyed
 def selection_counter(elements: Sortable) -> SelectionOutput:
     """Does the selection sort on the elements
 
@@ -20,6 +26,13 @@ def selection_counter(elements: Sortable) -> SelectionOutput:
      (number of elements, comparisons, swaps)
     """
     number_of_elements = len(elements)
+    if kernels.use_kernel(elements):
+        comparisons, swaps = kernels.selection(elements)
+        return SelectionOutput(element_count=number_of_elements,
+                               comparisons=comparisons,
+                               swaps=swaps,
+                               elements=elements)
+
     comparisons = swaps = 0
 
     for start_of_unselected in range(number_of_elements - 1):
@@ -29,7 +42,7 @@ def selection_counter(elements: Sortable) -> SelectionOutput:
             comparisons += 1
             if elements[next_unselected] < elements[smallest_unselected]:
                 smallest_unselected = next_unselected
-        swaps += 1
+        swaps += smallest_unselected != start_of_unselected
         elements[start_of_unselected], elements[smallest_unselected] = (
             elements[smallest_unselected], elements[start_of_unselected]
         )
@@ -39,18 +52,24 @@ def selection_counter(elements: Sortable) -> SelectionOutput:
                            elements=elements)
 
 
-def selection_swaps(elements: Sortable) -> Swaps:
-    """Keeps track of the element indexes as they are swapped
+def selection_swaps(elements: Sortable, trace: SwapTrace=None) -> SwapTrace:
+    """Does the selection sort and records the swaps
+
+    Every pass records a swap, even when the smallest element is already
+    in place, so the trace has one entry per pass. Use
+    ~trace.histories()~ to get the index history of every element (this
+    used to be what the function returned).
 
     Args:
      elements: list of orderable elements
+     trace: where to record the swaps (default is a new in-memory trace)
 
     Returns:
-     dict mapping element to list of indices where it was in the elements list
+     the trace of (i, j) index pairs that were swapped
     """
-    swaps = {element: [index] for index, element in enumerate(elements)}
-
     number_of_elements = len(elements)
+    if trace is None:
+        trace = SwapTrace(number_of_elements)
 
     for start_of_unselected in range(number_of_elements - 1):
         smallest_unselected = start_of_unselected
@@ -63,8 +82,6 @@ def selection_swaps(elements: Sortable) -> Swaps:
         elements[start_of_unselected], elements[smallest_unselected] = (
             elements[smallest_unselected], elements[start_of_unselected]
         )
-
-        # record the location of the elements
-        for index, element in enumerate(elements):
-            swaps[element].append(index)
-    return swaps
+        trace.record(start_of_unselected, smallest_unselected)
+    trace.flush()
+    return trace
@@ -0,0 +1,145 @@
+# python
+from collections import namedtuple
+from collections.abc import Callable, Iterable, MutableSequence
+from math import ceil
+from typing import Union
+
+# this project
+from bowling.sort.keys import keyed
+
+ShellOutput = namedtuple("ShellOutput", ["element_count",
+                                         "comparisons",
+                                         "shifts",
+                                         "elements"])
+
+GapSequence = Callable[[int], list[int]]
+
+CIURA = (1, 4, 10, 23, 57, 132, 301, 701, 1750)
+CIURA_GROWTH = 2.25
+
+
+def shell_gaps(size: int) -> list[int]:
+    """Shell's original gaps: n/2, n/4,..., 1
+
+    Args:
+     size: number of elements to sort
+
+    Returns:
+     the gaps, biggest first
+    """
+    gaps = []
+    gap = size//2
+    while gap > 0:
+        gaps.append(gap)
+        gap //= 2
+    return gaps or [1]
+
+
+def knuth_gaps(size: int) -> list[int]:
+    """Knuth's gaps (3^k - 1)/2: 1, 4, 13, 40,... up to a third of n
+
+    Args:
+     size: number of elements to sort
+
+    Returns:
+     the gaps, biggest first
+    """
+    gaps = [1]
+    while 3 * gaps[-1] + 1 <= max(size//3, 1):
+        gaps.append(3 * gaps[-1] + 1)
+    return gaps[::-1]
+
+
+def sedgewick_gaps(size: int) -> list[int]:
+    """Sedgewick's 1986 gaps 4^k + 3 * 2^(k-1) + 1: 1, 8, 23, 77, 281,...
+
+    Args:
+     size: number of elements to sort
+
+    Returns:
+     the gaps, biggest first
+    """
+    gaps = [1]
+    k = 1
+    while 4**k + 3 * 2**(k - 1) + 1 < size:
+        gaps.append(4**k + 3 * 2**(k - 1) + 1)
+        k += 1
+    return gaps[::-1]
+
+
+def tokuda_gaps(size: int) -> list[int]:
+    """Tokuda's gaps ceil((9 (9/4)^k - 4)/5): 1, 4, 9, 20, 46, 103,...
+
+    Args:
+     size: number of elements to sort
+
+    Returns:
+     the gaps, biggest first
+    """
+    gaps = [1]
+    k = 1
+    while (gap := ceil((9 * (9/4)**k - 4)/5)) < size:
+        gaps.append(gap)
+        k += 1
+    return gaps[::-1]
+
+
+def ciura_gaps(size: int) -> list[int]:
+    """Ciura's empirically found gaps, extended by multiplying by 2.25
+
+    Args:
+     size: number of elements to sort
+
+    Returns:
+     the gaps, biggest first
+    """
+    gaps = [gap for gap in CIURA if gap < size] or [1]
+    if gaps[-1] == CIURA[-1]:
+        while (gap := int(gaps[-1] * CIURA_GROWTH)) < size:
+            gaps.append(gap)
+    return gaps[::-1]
+
+
+@keyed
+def shell_sort(elements: MutableSequence,
+               gaps: Union[GapSequence, Iterable[int]]=ciura_gaps) -> ShellOutput:
+    """Sorts the elements with gapped insertion-sort passes
+
+    Each pass insertion-sorts the elements that are ~gap~ apart, so
+    elements far from home move in big jumps early on and the last pass
+    (with a gap of 1) is a plain insertion sort over nearly sorted
+    elements. The shifts are all the elements written, so an element
+    that moved counts once more when it's dropped into its place and
+    one that didn't move isn't written back.
+
+    Args:
+     elements: sortable collection of elements
+     gaps: function that builds the gaps for a size, or the gaps themselves
+
+    Returns:
+     count of elements, comparisons made, shifts made, sorted elements
+
+    Raises:
+     ValueError: the gaps don't end with 1 (so the result might not be sorted)
+    """
+    size = len(elements)
+    gaps = list(gaps(size) if callable(gaps) else gaps)
+    if not gaps or gaps[-1] != 1:
+        raise ValueError(f"The last gap has to be 1: {gaps}")
+
+    comparisons = shifts = 0
+    for gap in gaps:
+        for next_unsorted_cell in range(gap, size):
+            thing_to_insert = elements[next_unsorted_cell]
+            to_the_right = next_unsorted_cell
+            while to_the_right >= gap:
+                comparisons += 1
+                if not thing_to_insert < elements[to_the_right - gap]:
+                    break
+                elements[to_the_right] = elements[to_the_right - gap]
+                shifts += 1
+                to_the_right -= gap
+            if to_the_right != next_unsorted_cell:
+                elements[to_the_right] = thing_to_insert
+                shifts += 1
+    return ShellOutput(size, comparisons, shifts, elements)
@@ -0,0 +1,124 @@
+# python
+from array import array
+from collections.abc import Hashable, Iterator, Sequence
+from typing import BinaryIO
+
+# pypi
+# https://www.attrs.org/en/stable/index.html
+from attrs import define, field
+
+IndexHistory = list[int]
+Histories = dict[Hashable, IndexHistory]
+
+INDEX_TYPE = "I"
+FLUSH_AT = 2**16
+
+
+@define
+class SwapTrace:
+    """Records the index pairs of the swaps a sort makes
+
+    Each swap costs two unsigned ints in an array, no matter how many
+    elements there are. If a stream is given the pairs are written out
+    to it in blocks so memory stays flat for long traces (open it "w+b"
+    so it can be read back).
+
+    Args:
+     element_count: number of elements being sorted
+     stream: optional binary file to spill the pairs to
+     pairs: the buffered (first, second, first, second,...) indices
+     swap_count: total number of swaps recorded
+    """
+    element_count: int
+    stream: BinaryIO = None
+    pairs: array = field(factory=lambda: array(INDEX_TYPE))
+    swap_count: int = 0
+
+    def record(self, first: int, second: int) -> None:
+        """Adds a swap to the trace
+
+        Args:
+         first, second: the indices of the elements that were swapped
+        """
+        self.pairs.append(first)
+        self.pairs.append(second)
+        self.swap_count += 1
+        if self.stream is not None and len(self.pairs) >= FLUSH_AT:
+            self.flush()
+        return
+
+    def flush(self) -> None:
+        """Writes the buffered pairs to the stream (if there is one)"""
+        if self.stream is not None and self.pairs:
+            self.pairs.tofile(self.stream)
+            del self.pairs[:]
+        return
+
+    def swaps(self) -> Iterator[tuple[int, int]]:
+        """Replays the swaps in the order they were made
+
+        Yields:
+         (first, second) index pair for each swap
+        """
+        if self.stream is not None:
+            self.flush()
+            self.stream.seek(0)
+            while True:
+                block = array(INDEX_TYPE)
+                try:
+                    block.fromfile(self.stream, FLUSH_AT)
+                except EOFError:
+                    # whatever was left got read in before the error
+                    yield from zip(block[::2], block[1::2])
+                    break
+                yield from zip(block[::2], block[1::2])
+            self.stream.seek(0, 2)
+            return
+        yield from zip(self.pairs[::2], self.pairs[1::2])
+        return
+
+    def history(self, start: int) -> IndexHistory:
+        """Rebuilds where one element was after each swap
+
+        Args:
+         start: the index the element started at
+
+        Returns:
+         its index at the start and after every swap
+        """
+        position = start
+        history = [position]
+        for first, second in self.swaps():
+            if position == first:
+                position = second
+            elif position == second:
+                position = first
+            history.append(position)
+        return history
+
+    def histories(self, labels: Sequence[Hashable]=None) -> Histories:
+        """Rebuilds where every element was after each swap
+
+        Warning:
+         this takes O(elements x swaps) memory, it's meant for plotting
+         small sorts - use ~history~ or ~swaps~ for big ones
+
+        Args:
+         labels: names for the elements in their starting order (default is their starting index)
+
+        Returns:
+         label: list of indices of the element at the start and after each swap
+        """
+        where = list(range(self.element_count))
+        at = list(range(self.element_count))
+        histories = [[index] for index in where]
+        for first, second in self.swaps():
+            moved_first, moved_second = at[first], at[second]
+            at[first], at[second] = moved_second, moved_first
+            where[moved_first], where[moved_second] = second, first
+            for element, history in enumerate(histories):
+                history.append(where[element])
+
+        if labels is None:
+            labels = range(self.element_count)
+        return dict(zip(labels, histories))